@@ -37,7 +37,7 @@ class Monad(Applicative):
                         t("m", "a") >> (H/ "a" >> t("m", "b")) >> t("m", "b"))
         if not is_builtin(cls):
             def bind_wrap(s, o):
-                return Monad[s].bind(s, o)
+                return Monad.method('bind', s)(s, o)
             cls.__rshift__ = bind_wrap
         build_instance(Monad, cls, {"bind": bind})
 
@@ -49,7 +49,7 @@ def bind(m, fn):
     Monadic bind.
 
     """
-    return Monad[m].bind(m, fn)
+    return Monad.method('bind', m)(m, fn)
 
 
 @sig(H[Monad, "m"]/ t("m", t("m", "a")) >> t("m", "a"))
@@ -10,6 +10,9 @@ from hask3.lang.syntax import d
 from hask3.lang.syntax import deriving
 
 from hask3.lang.syntax import instance
+from hask3.lang.syntax import m
+from hask3.lang.syntax import pattern
+from hask3.lang.syntax import cases
 from hask3.Data.Eq import Eq
 from hask3.Data.Ord import Ord
 from hask3.Data.Functor import Functor
@@ -23,19 +26,25 @@ Either, Left, Right = (
     deriving(Read, Show, Eq, Ord)
 )
 
+_Left = pattern(Left(m.a))
+_Right = pattern(Right(m.b))
+
+_fmap_cases = cases(
+    (_Left, lambda f, a: Left(a)),
+    (_Right, lambda f, b: Right(f(b))))
+
 
 def _fmap(f, v):
-    from hask3.lang.syntax import caseof, m, p
-    return ~(caseof(v)
-                | m(Left(m.e))  >> Left(p.e)
-                | m(Right(m.ra)) >> Right(f(p.ra)))
+    return _fmap_cases(v, f)
+
+
+_bind_cases = cases(
+    (_Left, lambda f, a: Left(a)),
+    (_Right, lambda f, b: f(b)))
 
 
 def _bind(v, f):
-    from hask3.lang.syntax import caseof, m, p
-    return ~(caseof(v)
-                | m(Left(m.e))  >> Left(p.e)
-                | m(Right(m.a)) >> f(p.a))
+    return _bind_cases(v, f)
 
 
 instance(Functor, Either).where(
@@ -77,10 +86,10 @@ def either(fa, fb, e):
     first function to a; if it is Right(b), apply the second function to b.
 
     """
-    from hask3.lang.syntax import caseof, m, p
+    from hask3.lang.syntax import caseof, lazy, m, p
     return ~(caseof(e)
-                | m(Left(m.a))  >> fa(p.a)
-                | m(Right(m.b)) >> fb(p.b))
+                | m(_Left)  >> lazy(lambda: fa(p.a))
+                | m(_Right) >> lazy(lambda: fb(p.b)))
 
 
 @sig(H/ [t(Either, "a", "b")] >> ["a"])
@@ -116,8 +125,8 @@ def isLeft(x):
     """
     from hask3.lang.syntax import caseof, m
     return ~(caseof(x)
-                | m(Right(m.x)) >> False
-                | m(Left(m.x))  >> True)
+                | m(_Right) >> False
+                | m(_Left)  >> True)
 
 
 @sig(H/ t(Either, "a", "b") >> bool)
@@ -144,6 +153,6 @@ def partitionEithers(xs):
 
 del _bind, _fmap
 del Monad, Applicative, Functor, Ord, Eq, instance
-del deriving, d, data
+del deriving, d, data, m, pattern, cases
 del t, H, sig
 del Show, Read
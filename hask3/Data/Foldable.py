@@ -93,7 +93,7 @@ def foldr(f, z, t):
     Right-associative fold of a structure.
 
     """
-    return Foldable[t].foldr(f, z, t)
+    return Foldable.method('foldr', t)(f, z, t)
 
 
 @sig(H[(Foldable, "t")]/ (H/ "a" >> "a" >> "a") >> t("t", "a") >> "a")
@@ -104,7 +104,7 @@ def foldr1(f, t):
     non-empty structures.
 
     """
-    return Foldable[t].foldr(f, t)
+    return Foldable.method('foldr', t)(f, t)
 
 
 @sig(H[(Foldable, "t")]/ (H/ "a" >> "a" >> "b") >> "b" >> t("t", "a") >> "b")
@@ -114,7 +114,7 @@ def foldl(f, z, t):
     Left-associative fold of a structure.
 
     """
-    return Foldable[t].foldl(f, z, t)
+    return Foldable.method('foldl', t)(f, z, t)
 
 
 @sig(H[(Foldable, "t")]/ (H/ "a" >> "a" >> "b") >> "b" >> t("t", "a") >> "b")
@@ -125,7 +125,7 @@ def foldl_(f, z, t):
     operator.
 
     """
-    return Foldable[t].foldl_(f, z, t)
+    return Foldable.method('foldl_', t)(f, z, t)
 
 
 @sig(H[(Foldable, "t")]/ (H/ "a" >> "a" >> "a") >> t("t", "a") >> "a")
@@ -136,7 +136,7 @@ def foldl1(f, t):
     non-empty structures.
 
     """
-    Foldable[t].foldl1(f, t)
+    Foldable.method('foldl1', t)(f, t)
 
 
 @sig(H[(Foldable, "t")]/ t("t", "a") >> ["a"])
@@ -146,7 +146,7 @@ def toList(t):
     List of elements of a structure, from left to right.
 
     """
-    return Foldable[t].toList(t)
+    return Foldable.method('toList', t)(t)
 
 
 @sig(H[(Foldable, "t")]/ t("t", "a") >> bool)
@@ -156,7 +156,7 @@ def null(t):
     Test whether the structure is empty.
 
     """
-    return Foldable[t].null(t)
+    return Foldable.method('null', t)(t)
 
 
 @sig(H[(Foldable, "t")]/ t("t", "a") >> int)
@@ -166,7 +166,7 @@ def length(t):
     Returns the size/length of a finite structure as an int.
 
     """
-    return Foldable[t].length(t)
+    return Foldable.method('length', t)(t)
 
 
 @sig(H[(Foldable, "t"), (Eq, "a")]/ t("t", "a") >> "a")
@@ -176,7 +176,7 @@ def elem(a, t):
     Does the element occur in the structure?
 
     """
-    return Foldable[t].elem(t)
+    return Foldable.method('elem', t)(t)
 
 
 @sig(H[(Foldable, "t"), (Ord, "a")]/ t("t", "a") >> "a")
@@ -186,7 +186,7 @@ def maximum(t):
     The largest element of a non-empty structure.
 
     """
-    return Foldable[t].maximum(t)
+    return Foldable.method('maximum', t)(t)
 
 
 @sig(H[(Foldable, "t"), (Ord, "a")]/ t("t", "a") >> "a")
@@ -196,7 +196,7 @@ def minimum(t):
     The least element of a non-empty structure.
 
     """
-    return Foldable[t].minimum(t)
+    return Foldable.method('minimum', t)(t)
 
 
 @sig(H[(Foldable, "t"), (Num, "a")]/ t("t", "a") >> "a")
@@ -206,7 +206,7 @@ def sum(t):
     The sum function computes the sum of the numbers of a structure.
 
     """
-    return Foldable[t].sum(t)
+    return Foldable.method('sum', t)(t)
 
 
 @sig(H[(Foldable, "t"), (Num, "a")]/ t("t", "a") >> "a")
@@ -216,7 +216,7 @@ def product(t):
     The product function computes the product of the numbers of a structure.
 
     """
-    return Foldable[t].product(t)
+    return Foldable.method('product', t)(t)
 
 
 @sig(H[(Foldable, "t"), (Monad, "m")]/ (H/ "a" >> "b" >> t("m", "b")) >>
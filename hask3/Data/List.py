@@ -1,6 +1,8 @@
 from hask3.lang.syntax import H
 from hask3.lang.syntax import sig
 from hask3.lang.syntax import t
+from hask3.lang.syntax import m
+from hask3.lang.syntax import pattern
 
 from hask3.Data.Eq import Eq
 from hask3.Data.Ord import Ord
@@ -10,6 +12,23 @@ from hask3.Data.Num import Integral
 from hask3.Data.Maybe import Maybe
 
 
+_cons = pattern(m.y ^ m.ys)
+
+
+def _like(*xss):
+    """Return ``L.stream`` if any of `xss` is a stream, else ``L``.
+
+    Functions returning a List computed while reading their arguments once
+    use it to keep streams as such (see `~hask3.lang.lazylist.List.stream`).
+
+    """
+    from hask3.lang.lazylist import L, List
+    for xs in xss:
+        if isinstance(xs, List) and xs.is_stream:
+            return L.stream
+    return L
+
+
 @sig(H/ ["a"] >> "a")
 def head(xs):
     """``head :: [a] -> a``
@@ -79,8 +98,8 @@ def null(xs):
     """
     from hask3.lang.syntax import caseof, m
     return ~(caseof(xs)
-                | m(m.y ^ m.ys) >> False
-                | m(m.ys)       >> True)
+                | m(_cons) >> False
+                | m(m.ys)  >> True)
 
 
 @sig(H/ ["a"] >> int)
@@ -91,8 +110,17 @@ def length(xs):
     implementation is optimized for structures that are similar to cons-lists,
     because there is no general way to do better.
 
+    A stream is consumed to count its elements.
+
     """
-    return len(xs)
+    from hask3.lang.lazylist import List
+    if isinstance(xs, List) and xs.is_stream:
+        res = 0
+        for _ in xs:
+            res += 1
+        return res
+    else:
+        return len(xs)
 
 
 @sig(H/ (H/ "a" >> "b") >> ["a"] >> ["b"])
@@ -103,8 +131,7 @@ def map(f, xs):
 
     """
     from builtins import map as imap
-    from hask3.lang.lazylist import L
-    return L[imap(f, xs)]
+    return _like(xs)[imap(f, xs)]
 
 
 @sig(H/ ["a"] >> ["a"])
@@ -115,6 +142,9 @@ def reverse(xs):
 
     """
     from hask3.lang.lazylist import L
+    if xs.is_stream:
+        # a stream has no len(), which reversed() needs
+        return L[list(xs)[::-1]]
     return L[reversed(xs)]
 
 
@@ -271,8 +301,7 @@ def concat(xss):
     Concatenate a list of lists.
 
     """
-    from hask3.lang.lazylist import L
-    return L[(x for xs in xss for x in xs)]
+    return _like(xss)[(x for xs in xss for x in xs)]
 
 
 @sig(H/ (H/ "a" >> ["b"]) >> ["a"] >> ["b"])
@@ -339,11 +368,17 @@ def all(p, xs):
 def sum(xs):
     """``sum :: Num a => [a] -> a``
 
-    The sum function computes the sum of a finite list of numbers.
+    The sum function computes the sum of a finite list of numbers.  The sum
+    of an arithmetic sequence of integers is computed in closed form.
 
     """
     from functools import reduce
     import operator
+    from hask3.lang.lazylist import List
+    if isinstance(xs, List):
+        res = xs.closed_sum()
+        if res is not None:
+            return res
     return reduce(operator.add, xs, 0)
 
 
@@ -473,24 +508,24 @@ def iterate(f, x):
 def repeat(x):
     """``repeat :: a -> [a]``
 
-    Infinite list, with x the value of every element.
+    Infinite list, with x the value of every element.  The list is virtual
+    (see `~hask3.lang.lazylist.List`:class:), its elements are not stored.
 
     """
-    import itertools
-    from hask3.lang.lazylist import L
-    return L[itertools.repeat(x)]
+    from hask3.lang.lazylist import List
+    return List.cycle((x,))
 
 
 @sig(H/ int >> "a" >> ["a"])
 def replicate(n, x):
     """``replicate :: Int -> a -> [a]``
 
-    A list of length `n` with `x` the value of every element.
+    A list of length `n` with `x` the value of every element.  The list is
+    virtual, like those of `repeat`:func:.
 
     """
-    import itertools
-    from hask3.lang.lazylist import L
-    return L[itertools.repeat(x, n)]
+    from hask3.lang.lazylist import List
+    return List.cycle((x,), max(n, 0))
 
 
 @sig(H/ ["a"] >> ["a"])
@@ -500,10 +535,17 @@ def cycle(x):
     Ties a finite list into a circular one, or equivalently, the infinite
     repetition of the original list.  It is the identity on infinite lists.
 
+    The list is virtual, like those of `repeat`:func:: once `x` is evaluated,
+    the element at index `i` is ``x[i % length(x)]``.  The first element of
+    `x` is evaluated upfront, the list is empty if `x` is.
+
     """
-    import itertools
-    from hask3.lang.lazylist import L
-    return L[itertools.cycle(x)]
+    from hask3.lang.lazylist import List
+    if x.is_stream:
+        x = x.copy()
+    if x.uncons() is None:
+        return x
+    return List.cycle(x)
 
 
 @sig(H/ (H/ "b" >> t(Maybe, ("a", "b"))) >> "b" >> ["a"])
@@ -568,8 +610,7 @@ def takeWhile(p, xs):
 
     """
     import itertools
-    from hask3.lang.lazylist import L
-    return L[itertools.takewhile(p, xs)]
+    return _like(xs)[itertools.takewhile(p, xs)]
 
 
 @sig(H/ (H/ "a" >> bool) >> ["a"] >> ["a"])
@@ -580,8 +621,7 @@ def dropWhile(p, xs):
 
     """
     import itertools
-    from hask3.lang.lazylist import L
-    return L[itertools.dropwhile(p, xs)]
+    return _like(xs)[itertools.dropwhile(p, xs)]
 
 
 @sig(H/ (H/ "a" >> bool) >> ["a"] >> ["a"])
@@ -604,6 +644,8 @@ def span(p, xs):
     remainder of the list.
 
     """
+    if xs.is_stream:
+        xs = xs.copy()
     front = takeWhile(p, xs)
     rest = xs[len(front):]
     return front, rest
@@ -633,7 +675,9 @@ def stripPrefix(xs, ys):
 
     """
     from hask3.Data.Maybe import Just, Nothing
-    return Just(ys[len(xs)]) if isPrefixOf(xs, ys) else Nothing
+    if xs.is_stream:
+        xs = xs.copy()
+    return Just(ys[len(xs):]) if isPrefixOf(xs, ys) else Nothing
 
 
 @sig(H[(Eq, "a")]/ ["a"] >> [["a"]])
@@ -658,6 +702,8 @@ def inits(xs):
 
     """
     from hask3.lang.lazylist import L
+    if xs.is_stream:
+        xs = xs.copy()
     if null(xs):
         return L[[xs]]
     else:
@@ -672,6 +718,8 @@ def tails(xs):
 
     """
     from hask3.lang.lazylist import L
+    if xs.is_stream:
+        xs = xs.copy()
     if null(xs):
         return L[[L[[]]]]
     else:
@@ -685,6 +733,8 @@ def isPrefixOf(xs, ys):
     Returns True if the first list is a prefix of the second.
 
     """
+    if xs.is_stream:
+        xs = xs.copy()
     return xs == ys[:len(xs)]
 
 
@@ -696,6 +746,8 @@ def isSuffixOf(xs, ys):
     must be finite.
 
     """
+    if xs.is_stream:
+        xs = xs.copy()
     return xs == ys[-len(xs):]
 
 
@@ -774,8 +826,7 @@ def filter(p, xs):
     Returns the list of those elements that satisfy the predicate `p`.
 
     """
-    from hask3.lang.lazylist import L
-    return L[(x for x in xs if p(x))]
+    return _like(xs)[(x for x in xs if p(x))]
 
 
 @sig(H/ (H/ "a" >> bool) >> ["a"] >> (["a"], ["a"]))
@@ -813,8 +864,7 @@ def elemIndices(x, xs):
     to the query element, in ascending order.
 
     """
-    from hask3.lang.lazylist import L
-    return L[(i for i, a in enumerate(xs) if a == x)]
+    return _like(xs)[(i for i, a in enumerate(xs) if a == x)]
 
 
 @sig(H/ (H/ "a" >> bool) >> ["a"] >> t(Maybe, int))
@@ -837,8 +887,7 @@ def findIndicies(p, xs):
     satisfying the predicate `p`, in ascending order.
 
     """
-    from hask3.lang.lazylist import L
-    return L[(i for i, x in enumerate(xs) if p(x))]
+    return _like(xs)[(i for i, x in enumerate(xs) if p(x))]
 
 
 @sig(H/ ["a"] >> ["b"] >> [("a", "b")])
@@ -850,8 +899,7 @@ def zip(xs, ys):
 
     """
     from builtins import zip as izip
-    from hask3.lang.lazylist import L
-    return L[izip(xs, ys)]
+    return _like(xs, ys)[izip(xs, ys)]
 
 
 @sig(H/ ["a"] >> ["b"] >> ["c"] >> [("a", "b", "c")])
@@ -862,8 +910,7 @@ def zip3(a, b, c):
 
     """
     from builtins import zip as izip
-    from hask3.lang.lazylist import L
-    return L[izip(a, b, c)]
+    return _like(a, b, c)[izip(a, b, c)]
 
 
 @sig(H/ ["a"] >> ["b"] >> ["c"] >> ["d"] >> [("a", "b", "c", "d")])
@@ -874,8 +921,7 @@ def zip4(a, b, c, d):
 
     """
     from builtins import zip as izip
-    from hask3.lang.lazylist import L
-    return L[izip(a, b, c, d)]
+    return _like(a, b, c, d)[izip(a, b, c, d)]
 
 
 @sig(H/ ["a"] >> ["b"] >> ["c"] >> ["d"] >> ["e"] >>
@@ -888,8 +934,7 @@ def zip5(a, b, c, d, e):
 
     """
     from builtins import zip as izip
-    from hask3.lang.lazylist import L
-    return L[izip(a, b, c, d, e)]
+    return _like(a, b, c, d, e)[izip(a, b, c, d, e)]
 
 
 @sig(H/ ["a"] >> ["b"] >> ["c"] >> ["d"] >> ["e"] >> ["f"] >>
@@ -901,8 +946,7 @@ def zip6(a, b, c, d, e, f):
 
     """
     from builtins import zip as izip
-    from hask3.lang.lazylist import L
-    return L[izip(a, b, c, d, e, f)]
+    return _like(a, b, c, d, e, f)[izip(a, b, c, d, e, f)]
 
 
 @sig(H/ ["a"] >> ["b"] >> ["c"] >> ["d"] >> ["e"] >> ["f"] >> ["g"] >>
@@ -915,8 +959,7 @@ def zip7(a, b, c, d, e, f, g):
 
     """
     from builtins import zip as izip
-    from hask3.lang.lazylist import L
-    return L[izip(a, b, c, d, e, f, g)]
+    return _like(a, b, c, d, e, f, g)[izip(a, b, c, d, e, f, g)]
 
 
 @sig(H/ (H/ "a" >> "b" >> "c") >> ["a"] >> ["b"] >> ["c"])
@@ -928,8 +971,7 @@ def zipWith(fn, xs, ys):
     applied to two lists to produce the list of corresponding sums.
 
     """
-    from hask3.lang.lazylist import L
-    return L[(fn(*s) for s in zip(xs, ys))]
+    return _like(xs, ys)[(fn(*s) for s in zip(xs, ys))]
 
 
 @sig(H/ (H/ "a" >> "b" >> "c" >> "d") >> ["a"] >> ["b"] >> ["c"] >> ["d"])
@@ -941,8 +983,7 @@ def zipWith3(fn, a, b, c):
     `zipWith`:func:.
 
     """
-    from hask3.lang.lazylist import L
-    return L[(fn(*s) for s in zip3(a, b, c))]
+    return _like(a, b, c)[(fn(*s) for s in zip3(a, b, c))]
 
 
 @sig(H/ (H/ "a" >> "b" >> "c" >> "d" >> "e") >>
@@ -955,8 +996,7 @@ def zipWith4(fn, a, b, c, d):
     `zipWith`:func:.
 
     """
-    from hask3.lang.lazylist import L
-    return L[(fn(*s) for s in zip4(a, b, c, d))]
+    return _like(a, b, c, d)[(fn(*s) for s in zip4(a, b, c, d))]
 
 
 @sig(H/ (H/ "a" >> "b" >> "c" >> "d" >> "e" >> "f") >>
@@ -969,8 +1009,7 @@ def zipWith5(fn, a, b, c, d, e):
     `zipWith`:func:.
 
     """
-    from hask3.lang.lazylist import L
-    return L[(fn(*s) for s in zip5(a, b, c, d, e))]
+    return _like(a, b, c, d, e)[(fn(*s) for s in zip5(a, b, c, d, e))]
 
 
 @sig(H/ (H/ "a" >> "b" >> "c" >> "d" >> "e" >> "f" >> "g") >>
@@ -983,8 +1022,7 @@ def zipWith6(fn, a, b, c, d, e, f):
     `zipWith`:func:.
 
     """
-    from hask3.lang.lazylist import L
-    return L[(fn(*s) for s in zip6(a, b, c, d, e, f))]
+    return _like(a, b, c, d, e, f)[(fn(*s) for s in zip6(a, b, c, d, e, f))]
 
 
 @sig(H/ (H/ "a" >> "b" >> "c" >> "d" >> "e" >> "f" >> "g" >> "h") >>
@@ -997,8 +1035,7 @@ def zipWith7(fn, a, b, c, d, e, f):
     `zipWith`:func:.
 
     """
-    from hask3.lang.lazylist import L
-    return L[(fn(*s) for s in zip7(a, b, c, d, e, f))]
+    return _like(a, b, c, d, e, f)[(fn(*s) for s in zip7(a, b, c, d, e, f))]
 
 
 @sig(H/ [("a", "b")] >> (["a"], ["b"]))
@@ -1396,4 +1433,4 @@ def genericReplicate(i, a):
 
 
 del Maybe, Integral, Num, Ordering, Ord, Eq
-del t, sig, H
+del t, sig, H, m, pattern
@@ -9,6 +9,9 @@ from hask3.lang.syntax import data
 from hask3.lang.syntax import d
 from hask3.lang.syntax import deriving
 from hask3.lang.syntax import instance
+from hask3.lang.syntax import m
+from hask3.lang.syntax import pattern
+from hask3.lang.syntax import cases
 
 from hask3.Data.Eq import Eq
 from hask3.Data.Ord import Ord
@@ -22,12 +25,16 @@ Maybe, Nothing, Just = (
     data.Maybe("a") == d.Nothing | d.Just("a") & deriving(Read, Show, Eq, Ord)
 )
 
+# Compiled once, see `hask3.lang.syntax.pattern`.
+_Just = pattern(Just(m.a))
+
+_fmap_cases = cases(
+    (_Just, lambda f, a: Just(f(a))),
+    (Nothing, lambda f: Nothing))
+
 
 def _fmap(f, x):
-    from hask3.lang.syntax import caseof, m, p
-    return ~(caseof(x)
-                | m(Just(m.a)) >> Just(f(p.a))
-                | m(Nothing)   >> Nothing)
+    return _fmap_cases(x, f)
 
 
 instance(Functor, Maybe).where(
@@ -40,11 +47,13 @@ instance(Applicative, Maybe).where(
 )
 
 
+_bind_cases = cases(
+    (_Just, lambda f, a: f(a)),
+    (Nothing, lambda f: Nothing))
+
+
 def _bind(x, f):
-    from hask3.lang.syntax import caseof, m, p
-    return ~(caseof(x)
-                | m(Just(m.a)) >> f(p.a)
-                | m(Nothing)   >> Nothing)
+    return _bind_cases(x, f)
 
 
 instance(Monad, Maybe).where(
@@ -103,8 +112,8 @@ def isNothing(a):
     '''
     from hask3.lang.syntax import caseof, m
     return ~(caseof(a)
-                | m(Nothing)   >> True
-                | m(Just(m.x)) >> False)
+                | m(Nothing) >> True
+                | m(_Just)   >> False)
 
 
 @sig(H/ t(Maybe, "a") >> "a")
@@ -135,7 +144,7 @@ def fromMaybe(default, x):
     from hask3.lang.syntax import caseof, m, p
     return ~(caseof(x)
         | m(Nothing) >> default
-        | m(Just(m.x)) >> p.x
+        | m(_Just)   >> p.a
     )
 
 
@@ -167,8 +176,8 @@ def maybeToList(a):
     from hask3.lang.syntax import caseof, m, p
     from hask3.lang.lazylist import L
     return ~(caseof(a)
-                | m(Nothing)   >> L[[]]
-                | m(Just(m.x)) >> L[[p.x]])
+                | m(Nothing) >> L[[]]
+                | m(_Just)   >> L[[p.a]])
 
 
 @sig(H/ [t(Maybe, "a")] >> ["a"])
@@ -200,5 +209,5 @@ def mapMaybe(f, la):
 
 del Read, Show
 del H, sig, t
-del data, d, instance, deriving
+del data, d, instance, deriving, m, pattern, cases
 del Eq, Ord, Functor, Applicative, Monad
@@ -68,7 +68,7 @@ def negate(a):
     Unary negation.
 
     """
-    return Num[a].negate(a)
+    return Num.method('negate', a)(a)
 
 
 @sig(H[(Num, "a")]/ "a" >> "a")
@@ -81,7 +81,7 @@ def signum(a):
     (positive).
 
     """
-    return Num[a].signum(a)
+    return Num.method('signum', a)(a)
 
 
 @sig(H[(Num, "a")]/ "a" >> "a")
@@ -91,7 +91,7 @@ def abs(a):
     Absolute value.
 
     """
-    return Num[a].abs(a)
+    return Num.method('abs', a)(a)
 
 
 instance(Num, int).where(
@@ -21,6 +21,7 @@ from hask3.lang import NoGuardMatchException
 
 ## Lists/list comprehensions
 from hask3.lang import L
+from hask3.lang import StreamConsumedError
 
 ## ADT creation
 from hask3.lang import data
@@ -33,12 +34,17 @@ from hask3.lang import H
 from hask3.lang import t
 from hask3.lang import func
 from hask3.lang import TypeSignatureError
+from hask3.lang import typecheck
 
 ## Pattern matching
 from hask3.lang import caseof
+from hask3.lang import cases
+from hask3.lang import lazy
+from hask3.lang import pattern
 from hask3.lang import p
 from hask3.lang import m
 from hask3.lang import IncompletePatternError
+from hask3.lang import compiled
 
 ## REPL tools
 from hask3.lang import _t
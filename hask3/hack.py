@@ -200,4 +200,31 @@ def objectify(target, *args, **kwargs):
     return target(*args, **kwargs)
 
 
+def context_local(name, default):
+    '''Create a variable local to the current context.
+
+    A `contextvars.ContextVar`, so each thread and each asyncio task has its
+    own value.  On Python 3.6 a `threading.local` with the same `get` and
+    `set` methods is used instead (local to the thread only.)
+
+    '''
+    try:
+        from contextvars import ContextVar
+    except ImportError:
+        from threading import local
+
+        class ThreadLocal(local):
+            value = default
+
+            def get(self):
+                return self.value
+
+            def set(self, value):
+                self.value = value
+
+        return ThreadLocal()
+    else:
+        return ContextVar(name, default=default)
+
+
 del types, sys
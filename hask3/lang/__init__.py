@@ -15,6 +15,7 @@ from hask3.lang.lazylist import enumFromTo
 from hask3.lang.lazylist import enumFromThen
 from hask3.lang.lazylist import enumFromThenTo
 from hask3.lang.lazylist import List
+from hask3.lang.lazylist import StreamConsumedError
 
 # comprehensions and lazy creation of Haskell-style lists
 from hask3.lang.lazylist import L
@@ -26,6 +27,7 @@ from hask3.lang.type_system import Typeclass
 from hask3.lang.type_system import Hask
 from hask3.lang.type_system import TypedFunc
 from hask3.lang.type_system import TypeSignatureError
+from hask3.lang.type_system import typecheck
 
 # XXX: Why are these two needed here?
 from hask3.hack import is_builtin
@@ -33,6 +35,9 @@ from hask3.hack import nt_to_tuple
 
 from hask3.lang.syntax import undefined
 from hask3.lang.syntax import caseof
+from hask3.lang.syntax import cases
+from hask3.lang.syntax import lazy
+from hask3.lang.syntax import pattern
 from hask3.lang.syntax import m
 from hask3.lang.syntax import p
 from hask3.lang.syntax import IncompletePatternError
@@ -53,3 +58,5 @@ from hask3.lang.syntax import __
 from hask3.lang.syntax import _t
 from hask3.lang.syntax import _i
 from hask3.lang.syntax import _q
+
+from hask3.lang.compiler import compiled
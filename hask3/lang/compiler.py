@@ -0,0 +1,416 @@
+"""Rewrite pattern matching syntax into native Python statements.
+
+`compiled`:func: reads the source of a function and turns the statements::
+
+    return ~(caseof(value) | m(pattern) >> result ...)
+    name = ~(guard(value) | c(test) >> result ...)
+
+into ``match`` and ``if`` statements.  Only the body of the line that matched
+is evaluated, and no `~hask3.lang.syntax.MatchStack`:class: frame is pushed.
+
+"""
+import ast
+
+
+class _Unsupported(Exception):
+    """Raised when an expression can not be rewritten."""
+
+
+def compiled(fn):
+    """Rewrite the ``caseof`` and ``guard`` expressions of `fn`.
+
+    Must be the innermost decorator, e.g.::
+
+        @sig(H/ int >> int)
+        @compiled
+        def fib(x):
+            return ~(caseof(x)
+                        | m(0)   >> 1
+                        | m(1)   >> 1
+                        | m(m.n) >> fib(p.n - 1) + fib(p.n - 2))
+
+    Supported patterns are `~hask3.lang.syntax.m`:obj: binds, literals, tuples,
+    Python lists and ADT data constructors; ``p.*`` in a line refers to the
+    names bound by its pattern.  Constructors are looked up when the function
+    is decorated.
+
+    A ``caseof`` of an undefined value returns the value unchanged.
+
+    Expressions that can not be rewritten (list patterns, nested ``caseof`` in
+    a line, ...) keep the runtime implementation.  The function is returned
+    unchanged when nothing was rewritten, when its source is not available,
+    when it is a closure, or on Python older than 3.10.
+
+    """
+    import sys
+    from types import FunctionType
+    if sys.version_info < (3, 10) or not isinstance(fn, FunctionType):
+        return fn
+    elif fn.__code__.co_freevars:
+        return fn
+    else:
+        try:
+            return _compile(fn)
+        except (_Unsupported, OSError, TypeError, SyntaxError):
+            return fn
+
+
+def _compile(fn):
+    import inspect
+    from textwrap import dedent
+    from functools import update_wrapper
+    lines, lineno = inspect.getsourcelines(fn)
+    tree = ast.parse(dedent(''.join(lines)))
+    ast.increment_lineno(tree, lineno - 1)
+    fn_def = tree.body[0]
+    if not isinstance(fn_def, ast.FunctionDef) or not fn_def.decorator_list:
+        raise _Unsupported(fn)
+    last = fn_def.decorator_list[-1]
+    if getattr(last, 'id', getattr(last, 'attr', None)) != 'compiled':
+        raise _Unsupported(fn)
+    rewriter = _Rewriter(fn, fn_def)
+    rewriter.visit(fn_def)
+    if not rewriter.rewritten:
+        return fn
+    # Defaults and annotations were evaluated with the original function.
+    args = fn_def.args
+    args.defaults = []
+    args.kw_defaults = [None] * len(args.kwonlyargs)
+    for arg in args.posonlyargs + args.args + args.kwonlyargs:
+        arg.annotation = None
+    for arg in (args.vararg, args.kwarg):
+        if arg is not None:
+            arg.annotation = None
+    fn_def.returns = None
+    fn_def.decorator_list = []
+    fn_def.name = '_hask_compiled'
+    names = list(rewriter.names)
+    factory = ast.FunctionDef(
+        name='_hask_factory',
+        args=ast.arguments(
+            posonlyargs=[], args=[ast.arg(arg=n) for n in names],
+            kwonlyargs=[], kw_defaults=[], defaults=[]),
+        body=[fn_def, ast.Return(ast.Name('_hask_compiled', ast.Load()))],
+        decorator_list=[])
+    owner = _owner(fn)
+    if owner is not None:
+        # private names in a method are mangled with the name of its class
+        factory = ast.ClassDef(name=owner, bases=[], keywords=[],
+                               body=[factory], decorator_list=[])
+    module = ast.fix_missing_locations(ast.Module([factory], []))
+    code = compile(module, inspect.getsourcefile(fn) or '<compiled>', 'exec')
+    namespace = {}
+    exec(code, fn.__globals__, namespace)
+    if owner is not None:
+        namespace = vars(namespace[owner])
+    res = namespace['_hask_factory'](*(rewriter.names[n] for n in names))
+    res.__code__ = res.__code__.replace(co_name=fn.__code__.co_name)
+    res.__defaults__ = fn.__defaults__
+    res.__kwdefaults__ = fn.__kwdefaults__
+    return update_wrapper(res, fn)
+
+
+def _owner(fn):
+    """Return the name of the class `fn` is defined in, None if any."""
+    path = fn.__qualname__.split('.')
+    if len(path) > 1 and path[-2] != '<locals>':
+        return path[-2]
+    else:
+        return None
+
+
+class _Rewriter(ast.NodeTransformer):
+    """Replace the pattern matching statements of a function definition.
+
+    `names` maps the names injected in the generated code to their values.
+
+    """
+    def __init__(self, fn, fn_def):
+        from hask3.lang import syntax
+        self.fn = fn
+        self.syntax = syntax
+        self.imports = {}
+        for node in ast.walk(fn_def):
+            if isinstance(node, ast.ImportFrom) and not node.level:
+                for alias in node.names:
+                    name = alias.asname or alias.name
+                    self.imports[name] = (node.module, alias.name)
+        self.names = {}
+        self.counter = 0
+        self.rewritten = False
+
+    def visit_ClassDef(self, node):
+        return node
+
+    def visit_Return(self, node):
+        return self.rewrite(node, node.value, ast.Return)
+
+    def visit_Assign(self, node):
+        target, = node.targets if len(node.targets) == 1 else (None, )
+        if isinstance(target, ast.Name):
+            def emit(value):
+                return ast.Assign([ast.Name(target.id, ast.Store())], value)
+            return self.rewrite(node, node.value, emit)
+        else:
+            return node
+
+    def rewrite(self, node, expr, emit):
+        """Rewrite statement `node` whose value is `expr`.
+
+        :param emit: builds the statement that produces a value
+
+        """
+        if isinstance(expr, ast.UnaryOp) and isinstance(expr.op, ast.Invert):
+            lines = []
+            head = expr.operand
+            while isinstance(head, ast.BinOp) and \
+                    isinstance(head.op, ast.BitOr):
+                lines.insert(0, head.right)
+                head = head.left
+            if isinstance(head, ast.Call) and len(head.args) == 1:
+                if lines and not head.keywords:
+                    try:
+                        if self.refers(head.func, self.syntax.caseof):
+                            res = self.caseof(head.args[0], lines, emit)
+                        elif self.refers(head.func, self.syntax.guard):
+                            res = self.guard(head.args[0], lines, emit)
+                        else:
+                            res = None
+                    except _Unsupported:
+                        res = None
+                    if res is not None:
+                        self.rewritten = True
+                        for stmt in res:
+                            ast.copy_location(stmt, node)
+                        return res
+        return node
+
+    def caseof(self, value, lines, emit):
+        subject = self.local('subject')
+        cases = [ast.match_case(
+            pattern=ast.MatchClass(self.inject(self.syntax.Undefined),
+                                   [], [], []),
+            body=[emit(ast.Name(subject, ast.Load()))])]
+        for line in lines:
+            if not isinstance(line, ast.BinOp) or \
+               not isinstance(line.op, ast.RShift):
+                raise _Unsupported(line)
+            test = line.left
+            if not isinstance(test, ast.Call) or len(test.args) != 1 or \
+               test.keywords or not self.refers(test.func, self.syntax.m):
+                raise _Unsupported(line)
+            binds, guards = {}, []
+            pattern = self.pattern(test.args[0], binds, guards)
+            if not guards:
+                guard = None
+            elif len(guards) == 1:
+                guard = guards[0]
+            else:
+                guard = ast.BoolOp(ast.And(), guards)
+            body = self.body(line.right, binds)
+            cases.append(ast.match_case(pattern, guard, [emit(body)]))
+            if guard is None and isinstance(pattern, ast.MatchAs) and \
+               pattern.pattern is None:
+                # The lines after an irrefutable pattern are unreachable,
+                # and a match statement would reject them.
+                break
+        else:
+            error = self.inject(self.syntax.IncompletePatternError)
+            subject_ = ast.Name(subject, ast.Load())
+            raise_ = ast.Raise(self.call(error, subject_))
+            cases.append(ast.match_case(ast.MatchAs(), None, [raise_]))
+        return [ast.Assign([ast.Name(subject, ast.Store())], value),
+                ast.Match(ast.Name(subject, ast.Load()), cases)]
+
+    def guard(self, value, lines, emit):
+        subject = self.local('subject')
+        tests = []
+        default = None
+        for line in lines:
+            if not isinstance(line, ast.BinOp) or \
+               not isinstance(line.op, ast.RShift):
+                raise _Unsupported(line)
+            test, body = line.left, self.body(line.right, {})
+            if self.refers(test, self.syntax.otherwise):
+                default = [emit(body)]
+                break
+            elif isinstance(test, ast.Call) and len(test.args) == 1 and \
+                    not test.keywords and \
+                    self.refers(test.func, self.syntax.c):
+                check = self.call(test.args[0], ast.Name(subject, ast.Load()))
+                tests.append((check, [emit(body)]))
+            else:
+                raise _Unsupported(line)
+        if default is None:
+            error = self.inject(self.syntax.NoGuardMatchException)
+            msg = ast.JoinedStr([
+                ast.Constant('No match found in guard('),
+                ast.FormattedValue(ast.Name(subject, ast.Load()), -1),
+                ast.Constant(')')])
+            default = [ast.Raise(self.call(error, msg))]
+        res = default
+        for check, body in reversed(tests):
+            res = [ast.If(check, body, res)]
+        return [ast.Assign([ast.Name(subject, ast.Store())], value)] + res
+
+    def pattern(self, node, binds, guards):
+        """Translate a pattern expression into an `ast.pattern`.
+
+        :param binds: maps the names bound by ``m.*`` to local names
+
+        :param guards: collects the conditions the pattern adds to its line
+
+        """
+        if isinstance(node, ast.Attribute) and self.refers(node.value,
+                                                           self.syntax.m):
+            if node.attr in binds:
+                raise _Unsupported(node)
+            binds[node.attr] = self.local(node.attr)
+            return ast.MatchAs(name=binds[node.attr])
+        elif isinstance(node, (ast.Tuple, ast.List)):
+            # The class test comes first: the sequence pattern takes the
+            # length of any sequence, infinite lazy lists included.
+            if any(isinstance(elt, ast.Starred) for elt in node.elts):
+                raise _Unsupported(node)
+            kind = tuple if isinstance(node, ast.Tuple) else list
+            name = self.exact(kind, guards)
+            items = [self.pattern(elt, binds, guards) for elt in node.elts]
+            sequence = ast.MatchClass(self.inject(kind),
+                                      [ast.MatchSequence(items)], [], [])
+            return ast.MatchAs(sequence, name)
+        elif isinstance(node, (ast.Constant, ast.UnaryOp)):
+            try:
+                value = ast.literal_eval(node)
+            except ValueError:
+                raise _Unsupported(node)
+            if value is None or isinstance(value, bool):
+                return ast.MatchSingleton(value)
+            elif isinstance(value, (int, float, complex, str, bytes)):
+                name = self.exact(type(value), guards)
+                guards.append(ast.Compare(ast.Name(name, ast.Load()),
+                                          [ast.Eq()], [ast.Constant(value)]))
+                return ast.MatchAs(name=name)
+            else:
+                raise _Unsupported(node)
+        elif isinstance(node, ast.Call) and not node.keywords:
+            cls = self.constructor(self.resolve(node.func))
+            if cls is None or len(node.args) != len(cls._fields):
+                raise _Unsupported(node)
+            items = [self.pattern(arg, binds, guards) for arg in node.args]
+            return ast.MatchClass(self.inject(cls), items, [], [])
+        elif isinstance(node, ast.Name):
+            from hask3.lang.type_system import ADT
+            value = self.resolve(node)
+            if isinstance(value, ADT) and not type(value)._fields:
+                return ast.MatchClass(self.inject(type(value)), [], [], [])
+            else:
+                raise _Unsupported(node)
+        else:
+            raise _Unsupported(node)
+
+    def exact(self, cls, guards):
+        """Return a local name whose value must be of type `cls` exactly.
+
+        Patterns only match values of the same type, e.g. ``m(1)`` does not
+        match ``True`` or ``1.0``.
+
+        """
+        name = self.local('value')
+        guards.append(ast.Compare(
+            self.call(self.inject(type), ast.Name(name, ast.Load())),
+            [ast.Is()], [self.inject(cls)]))
+        return name
+
+    def body(self, node, binds):
+        """Return the body of a line with ``p.*`` replaced by local names.
+
+        The body of a `~hask3.lang.syntax.lazy`:class: thunk written as a
+        lambda is used directly.
+
+        """
+        syntax = self.syntax
+        rewriter = self
+        if isinstance(node, ast.Call) and len(node.args) == 1 and \
+           not node.keywords and self.refers(node.func, syntax.lazy):
+            thunk = node.args[0]
+            if isinstance(thunk, ast.Lambda) and \
+               not any(getattr(thunk.args, f) for f in thunk.args._fields):
+                node = thunk.body
+            else:
+                node = ast.Call(ast.Attribute(node, 'thunk', ast.Load()),
+                                [], [])
+
+        class Binds(ast.NodeTransformer):
+            def visit_Attribute(self, node):
+                if rewriter.refers(node.value, syntax.p):
+                    if node.attr not in binds:
+                        raise _Unsupported(node)
+                    return ast.copy_location(
+                        ast.Name(binds[node.attr], ast.Load()), node)
+                return self.generic_visit(node)
+
+            def visit_Name(self, node):
+                matching = (syntax.caseof, syntax.guard, syntax.m, syntax.p)
+                if any(rewriter.refers(node, obj) for obj in matching):
+                    raise _Unsupported(node)
+                return node
+
+        return Binds().visit(node)
+
+    def constructor(self, value):
+        """Return the data constructor class of `value`, or None."""
+        from hask3.lang.type_system import ADT, TypedFunc
+        if isinstance(value, TypedFunc):
+            value = value.func
+        if isinstance(value, type) and issubclass(value, ADT) and \
+           hasattr(value, '__ADT_slot__'):
+            return value
+        else:
+            return None
+
+    def resolve(self, node):
+        """Return the value of the name `node` refers to."""
+        import builtins
+        from importlib import import_module
+        if not isinstance(node, ast.Name):
+            raise _Unsupported(node)
+        name = node.id
+        if name in self.imports:
+            module, attr = self.imports[name]
+            try:
+                return getattr(import_module(module), attr)
+            except (ImportError, AttributeError):
+                raise _Unsupported(node)
+        elif name in self.fn.__globals__:
+            return self.fn.__globals__[name]
+        elif hasattr(builtins, name):
+            return getattr(builtins, name)
+        else:
+            raise _Unsupported(node)
+
+    def refers(self, node, obj):
+        """Whether `node` is a name for `obj`."""
+        try:
+            return self.resolve(node) is obj
+        except _Unsupported:
+            return False
+
+    def inject(self, value):
+        """Return an expression evaluating to `value` in the generated code."""
+        for name, obj in self.names.items():
+            if obj is value:
+                break
+        else:
+            name = getattr(value, '__name__', 'value')
+            name = f'_hask_{name}_{len(self.names)}'
+            self.names[name] = value
+        return ast.Name(name, ast.Load())
+
+    def local(self, name):
+        """Return a new local variable name."""
+        self.counter += 1
+        return f'_hask_{name}_{self.counter}'
+
+    @staticmethod
+    def call(fn, arg):
+        return ast.Call(fn, [arg], [])
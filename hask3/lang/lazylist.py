@@ -1,4 +1,6 @@
+from abc import ABC, abstractmethod
 from collections.abc import Sequence
+from threading import Lock
 from hask3.hack import objectify
 from hask3.lang.type_system import Typeclass
 from hask3.lang.type_system import Hask
@@ -134,7 +136,10 @@ def enumFromThen(start, second):
     Used in translation of ``[n, n_, ...]``.
 
     """
-    return L[Enum[start].enumFromThen(start, second)]
+    res = _arith(start, second)
+    if res is None:
+        res = L[Enum[start].enumFromThen(start, second)]
+    return res
 
 
 @sig(H/ "a" >> ["a"])
@@ -144,7 +149,11 @@ def enumFrom(start):
     Used in translation of L[n, ...]
 
     """
-    return L[Enum[start].enumFrom(start)]
+    enum = Enum[start]
+    res = _arith(start, enum.succ(start))
+    if res is None:
+        res = L[enum.enumFrom(start)]
+    return res
 
 
 @sig(H/ "a" >> "a" >> "a" >> ["a"])
@@ -154,7 +163,10 @@ def enumFromThenTo(start, second, end):
     Used in translation of ``L[n, n_, ..., m]``.
 
     """
-    return L[Enum[start].enumFromThenTo(start, second, end)]
+    res = _arith(start, second, end)
+    if res is None:
+        res = L[Enum[start].enumFromThenTo(start, second, end)]
+    return res
 
 
 @sig(H/ "a" >> "a" >> ["a"])
@@ -164,7 +176,12 @@ def enumFromTo(start, end):
     Used in translation of L[n, ..., m]
 
     """
-    return L[Enum[start].enumFromTo(start, end)]
+    enum = Enum[start]
+    second = enum.succ(start) if start < end else enum.pred(start)
+    res = _arith(start, second, end)
+    if res is None:
+        res = L[enum.enumFromTo(start, end)]
+    return res
 
 
 instance(Enum, int).where(fromEnum=int, toEnum=int)
@@ -172,70 +189,867 @@ instance(Enum, bool).where(fromEnum=int, toEnum=bool)
 instance(Enum, str).where(fromEnum=ord, toEnum=chr)
 
 
+def _is_plain(cls):
+    """Tell if the type of all instances of `cls` is just `cls`."""
+    from hask3.lang.type_system import Hask
+    return not issubclass(cls, (Hask, tuple))
+
+
+class _Cells:
+    """The storage of a `List`:class:, shared with its views.
+
+    `items` are the elements evaluated so far and `tail` the iterator of the
+    rest, None when it's exhausted.  The type of the elements is shared by
+    all the Lists on the storage.
+
+    Elements consed in front of the storage are kept in `front`, in reverse
+    order, so that prepending doesn't move the other elements.  Positions
+    are relative to the first element of `items`: the element at position
+    ``-1`` is ``front[0]``, the one at ``-2`` is ``front[1]``, and so on.
+
+    The storage of a stream (see `List.stream`:meth:) releases the elements
+    already read: `base` is the position of the first element in `items`.
+
+    The storage of a virtual List has the `_Virtual`:class: that computes
+    its elements in `virtual`.  Those elements are never evaluated by
+    iterating the List, so it takes constant memory.
+
+    """
+    __slots__ = ('items', 'tail', 'front', 'item_class', 'item_type',
+                 'checked', 'chunk_size', 'stream', 'base', 'virtual')
+
+    def __init__(self, items, tail=None, item_class=None):
+        self.items = items
+        self.tail = tail
+        self.front = []
+        self.item_class = item_class
+        self.item_type = None
+        # True if the elements of the tail are already type-checked
+        self.checked = False
+        self.chunk_size = None
+        self.stream = False
+        self.base = 0
+        self.virtual = None
+
+    @property
+    def end(self):
+        """The position after the last evaluated element."""
+        return self.base + len(self.items)
+
+    @property
+    def size(self):
+        """The position after the last element, None if it's not known yet."""
+        virtual = self.virtual
+        if virtual is not None and virtual.count is not None:
+            return virtual.count
+        elif self.tail is None:
+            return self.end
+        else:
+            return None
+
+    def consumed(self, position):
+        """Return the error for reading a released `position`."""
+        return StreamConsumedError(f"Element {position} of the stream was "
+                                   "already consumed, streams can be read "
+                                   "only once")
+
+    def release(self, position):
+        """Release the elements of a stream before `position`."""
+        count = min(position - self.base, len(self.items))
+        if count > 0:
+            if self.item_type is None:
+                self.keep_type(self.items[0])
+            del self.items[:count]
+            self.base += count
+
+    def keep_type(self, item):
+        """Keep the type of a released `item` for the elements to come."""
+        from hask3.lang.type_system import typeof
+        from hask3.lang.hindley_milner import TypeVariable, unify
+        self.item_type = TypeVariable(level=0)
+        unify(self.item_type, typeof(item))
+
+    def slice(self, start, stop=None):
+        """Return a Python list with the evaluated elements in a range."""
+        if stop is not None and stop <= start:
+            return []
+        items = self.items
+        base = self.base
+        if base:
+            if start < base:
+                raise self.consumed(start)
+            start -= base
+            if stop is not None:
+                stop = max(stop - base, 0)
+        if start >= 0:
+            if stop is None:
+                return items[start:] if start else items
+            else:
+                return items[start:stop]
+        else:
+            front = self.front
+            if stop is None or stop >= 0:
+                return front[-1 - start::-1] + items[:stop]
+            elif stop > start:
+                return front[-1 - start:-1 - stop:-1]
+            else:
+                return []
+
+    def first(self):
+        """Return the element at the lowest position, there must be one."""
+        front = self.front
+        return front[-1] if front else self.items[0]
+
+    def take(self, count):
+        """Evaluate up to `count` elements of the tail and add them to items.
+
+        The elements are taken with a single `~itertools.islice`:func: and
+        type-checked in bulk.
+
+        :returns: False if the tail was already exhausted.
+
+        """
+        from itertools import islice
+        if self.tail is None:
+            return False
+        chunk = list(islice(self.tail, count))
+        if len(chunk) < count:
+            self.tail = None
+            if not chunk:
+                return False
+        if not self.checked:
+            try:
+                self.check(chunk)
+            except TypeError:
+                self.keep_checked(chunk)
+                raise
+        self.items.extend(chunk)
+        return True
+
+    def keep_checked(self, chunk):
+        """Add the elements of a `chunk` that failed the type check to items.
+
+        Only those before the first ill-typed element are added.  That one and
+        the rest are put back in front of the tail, so reading them again
+        raises the error again.
+
+        """
+        from itertools import chain
+        for i, item in enumerate(chunk):
+            try:
+                self.check((item,))
+            except TypeError:
+                rest = chunk[i:]
+                tail = self.tail
+                self.tail = iter(rest) if tail is None else chain(rest, tail)
+                return
+            self.items.append(item)
+
+    def check(self, chunk):
+        """Unify the types of the elements in `chunk` with the storage's."""
+        item_class = self.item_class
+        first = None
+        for item in chunk:
+            cls = type(item)
+            if cls is not item_class:
+                # elements of the same plain class don't need unification
+                from hask3.lang.type_system import typeof
+                from hask3.lang.hindley_milner import unify
+                if self.item_type is not None:
+                    unify(self.item_type, typeof(item))
+                elif self.items or self.front:
+                    unify(typeof(self.first()), typeof(item))
+                elif first is not None:
+                    unify(typeof(first), typeof(item))
+                else:
+                    first = item
+                if item_class is None and _is_plain(cls):
+                    item_class = self.item_class = cls
+
+    def pull(self):
+        """Evaluate the next chunk of the tail, and add it to the items.
+
+        The size of the chunk is the `List.chunk_size`:attr: of the Lists on
+        the storage.
+
+        :returns: False if the tail was already exhausted.
+
+        """
+        size = self.chunk_size or List.default_chunk_size
+        if size > 1:
+            return self.take(size)
+        elif self.tail is None:
+            return False
+        try:
+            item = next(self.tail)
+        except StopIteration:
+            self.tail = None
+            return False
+        if type(item) is not self.item_class and not self.checked:
+            try:
+                self.check((item,))
+            except TypeError:
+                self.keep_checked((item,))
+                raise
+        self.items.append(item)
+        return True
+
+    def fill(self, count):
+        """Evaluate the tail until the `end`:attr: is at least `count`.
+
+        :returns: the end, less than `count` only if the tail is exhausted.
+
+        """
+        size = self.chunk_size or List.default_chunk_size
+        while self.end < count and self.take(max(count - self.end, size)):
+            pass
+        return self.end
+
+    def evaluate(self, keep=None):
+        """Evaluate the entire tail.
+
+        :param keep: if not None and this is the storage of a stream, release
+                     all but the last `keep` elements as they are evaluated.
+
+        """
+        release = self.stream and keep is not None
+        while self.take(_EVALUATE_CHUNK):
+            if release:
+                self.release(self.end - keep)
+
+
+#: The number of elements taken at once when a List is entirely evaluated.
+_EVALUATE_CHUNK = 4096
+
+
+#: Held to put an element in front of a storage, so that only one of the
+#: threads consing onto the same List takes its place.
+_CONS_LOCK = Lock()
+
+
+class _Virtual(ABC):
+    """The elements of a virtual List, computed from their positions.
+
+    `count` is the number of elements, None if there are infinitely many.
+
+    """
+    __slots__ = ()
+
+    @abstractmethod
+    def get(self, p):
+        """Return the element at the position `p`."""
+
+    def contains(self, x, start, stop=None):
+        """Tell if `x` is in the elements from the position `start` to `stop`.
+
+        :returns: NotImplemented if it can't be told without comparing the
+                  elements one by one.
+
+        """
+        return NotImplemented
+
+    def slice(self, positions):
+        """Return the elements at the range `positions`.
+
+        :returns: a `_Virtual`:class:, or None if it can't be computed
+                  without evaluating the elements.
+
+        """
+        return None
+
+    def sum(self):
+        """Return the sum of a finite sequence of `int`, in closed form.
+
+        :returns: NotImplemented if the elements must be added one by one.
+
+        """
+        return NotImplemented
+
+    def item_class(self):
+        """Return the class of all the elements, None if they may differ."""
+        return None
+
+    def item_type(self):
+        """Return the type of the elements."""
+        from hask3.lang.type_system import typeof
+        return typeof(self.get(0))
+
+    @abstractmethod
+    def iterate(self, start):
+        """Iterate the elements from the position `start`."""
+
+    def __iter__(self):
+        return self.iterate(0)
+
+
+class _Arith(_Virtual):
+    """An arithmetic sequence of `int`, `bool` or `str` values.
+
+    The element at position `p` is ``to(first + p * step)``, where `to` is
+    the ``toEnum`` of the type (None for `int`).
+
+    """
+    __slots__ = ('first', 'step', 'count', 'to')
+
+    def __init__(self, first, step, count=None, to=None):
+        self.first = first
+        self.step = step
+        self.count = count
+        self.to = to
+
+    def get(self, p):
+        n = self.first + p * self.step
+        return n if self.to is None else self.to(n)
+
+    def contains(self, x, start, stop=None):
+        if self.to is None and type(x) is int:
+            n = x
+        elif self.to is chr and type(x) is str and len(x) == 1:
+            n = ord(x)
+        else:
+            return NotImplemented
+        if not self.step:
+            return NotImplemented
+        p, r = divmod(n - self.first, self.step)
+        count = self.count
+        return not r and start <= p and (count is None or p < count) and \
+            (stop is None or p < stop)
+
+    def slice(self, positions):
+        first = self.first + positions.start * self.step
+        return _Arith(first, positions.step * self.step, len(positions),
+                      self.to)
+
+    def sum(self):
+        if self.to is not None:
+            return NotImplemented
+        count = self.count
+        return count * self.first + self.step * count * (count - 1) // 2
+
+    def item_class(self):
+        return type(self.get(0))
+
+    def iterate(self, start):
+        from itertools import count, repeat
+        first, step = self.first + start * self.step, self.step
+        if self.count is None:
+            res = count(first, step)
+        elif step:
+            res = range(first, first + (self.count - start) * step, step)
+        else:
+            res = repeat(first, max(self.count - start, 0))
+        return iter(res) if self.to is None else map(self.to, res)
+
+
+class _Cycle(_Virtual):
+    """The elements of a non-empty sequence `items` repeated in a cycle.
+
+    The element at position `p` is ``items[p % len(items)]``.  `items` is a
+    tuple, or a List whose length is only known (and the List converted to a
+    tuple) when an element past its end is needed; if the List is infinite
+    the cycle is the List itself.  `count` may be not None only if `items`
+    is a tuple.
+
+    """
+    __slots__ = ('items', 'period', 'count')
+
+    def __init__(self, items, count=None):
+        self.items = items
+        self.period = len(items) if type(items) is tuple else None
+        self.count = count
+
+    def get(self, p):
+        period = self.period
+        if period is None:
+            try:
+                return self.items[p]
+            except IndexError:
+                self.items = tuple(self.items)
+                period = self.period = len(self.items)
+        return self.items[p % period]
+
+    def contains(self, x, start, stop=None):
+        period, count = self.period, self.count
+        if count is not None:
+            stop = count if stop is None else min(stop, count)
+        if period is None or (stop is not None and stop - start < period):
+            return NotImplemented
+        else:
+            # every element is found in any `period` consecutive positions
+            return x in self.items
+
+    def slice(self, positions):
+        from math import gcd
+        period = self.period
+        if period is None:
+            return None
+        # the positions repeat the same elements in cycles of this size
+        size = min(period // gcd(period, positions.step), len(positions))
+        items = self.items
+        start, step = positions.start, positions.step
+        cycle = tuple(items[(start + k * step) % period]
+                      for k in range(max(size, 1)))
+        return _Cycle(cycle, len(positions))
+
+    def sum(self):
+        items, count = self.items, self.count
+        if count is None or set(map(type, items)) != {int}:
+            return NotImplemented
+        loops, rest = divmod(count, self.period)
+        return loops * sum(items) + sum(items[:rest])
+
+    def item_class(self):
+        items = self.items
+        if type(items) is tuple:
+            classes = set(map(type, items))
+            if len(classes) == 1:
+                cls = classes.pop()
+                if _is_plain(cls):
+                    return cls
+        return None
+
+    def item_type(self):
+        from hask3.lang.type_system import typeof
+        items = self.items
+        if type(items) is tuple:
+            return typeof(items[0])
+        else:
+            return typeof(items).types[0]
+
+    def iterate(self, start):
+        from itertools import cycle, islice
+        p = start
+        while self.period is None:
+            yield self.get(p)
+            p += 1
+        items, k = self.items, p % self.period
+        res = cycle(items[k:] + items[:k])
+        if self.count is None:
+            yield from res
+        else:
+            yield from islice(res, max(self.count - p, 0))
+
+
+def _arith(start, second, end=None):
+    """Return the List of an arithmetic sequence of Enum values.
+
+    Return None if the type of the values is not one of those represented
+    by an `_Arith`:class:.  The elements are those produced by the methods
+    ``enumFromThen`` (if `end` is None) and ``enumFromThenTo`` of the Enum
+    instance.
+
+    """
+    cls = type(start)
+    if cls is int:
+        to, fromEnum = None, int
+    elif cls is str and len(start) == 1:
+        to, fromEnum = chr, ord
+    elif cls is bool:
+        to, fromEnum = bool, int
+    else:
+        return None
+    if type(second) is not cls or (end is not None and type(end) is not cls):
+        return None
+    first = fromEnum(start)
+    step = fromEnum(second) - first
+    if end is None:
+        count = None
+    elif start == end:
+        count = 1
+    elif (second >= start > end) or (second <= start < end):
+        count = 0
+    else:
+        count = (fromEnum(end) - first) // step + 1
+    arith = _Arith(first, step, count, to)
+    if count == 0:
+        return List()
+    else:
+        return List(tail=arith)
+
+
+class _Concat:
+    """The iterator of a concatenation of Lists (a rope).
+
+    Each node links a `segment` to the previous nodes.  A segment is either
+    a List (or any iterable) or another rope, spliced: the rope of an operand
+    of ``+`` is linked instead of the List on it.  Iterators are never
+    nested, a List built with ``+`` is flattened in a single chain when its
+    first element is needed.
+
+    """
+    __slots__ = ('prev', 'segment', 'iter')
+
+    def __init__(self, prev, segment):
+        self.prev = prev
+        self.segment = segment
+        self.iter = None
+
+    def segments(self):
+        """Return the list of the segments in order, spliced ropes expanded."""
+        res = []
+        nodes = [self]
+        while nodes:
+            node = nodes.pop()
+            if type(node) is _Concat:
+                nodes.append(node.segment)
+                if node.prev is not None:
+                    nodes.append(node.prev)
+            else:
+                res.append(node)
+        return res
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.iter is None:
+            from itertools import chain
+            self.iter = chain.from_iterable(self.segments())
+        return next(self.iter)
+
+
+def _iter_cells(cells, start, stop=None):
+    """Iterate the items of `cells` from the position `start` to `stop`."""
+    from itertools import islice
+    items = cells.items
+    i = start
+    if i < 0:
+        front = cells.front
+        while i < 0 and (stop is None or i < stop):
+            yield front[-1 - i]
+            i += 1
+    while stop is None or i < stop:
+        if i < len(items):
+            yield items[i]
+            i += 1
+        elif cells.virtual is not None:
+            # computed, not evaluated
+            rest = cells.virtual.iterate(i)
+            if stop is not None:
+                rest = islice(rest, stop - i)
+            yield from rest
+            return
+        elif not cells.pull():
+            return
+
+
+def _iter_stream(cells, start, stop=None):
+    """Iterate the items of a stream, releasing them as they are read."""
+    i = start
+    while stop is None or i < stop:
+        base = cells.base
+        k = i - base
+        if k < 0:
+            if i < 0 and not base:
+                yield cells.front[-1 - i]
+                i += 1
+            else:
+                raise cells.consumed(i)
+        elif k < len(cells.items):
+            if k >= _EVALUATE_CHUNK:
+                # release the elements read in batches
+                cells.release(i)
+            yield cells.items[i - cells.base]
+            i += 1
+        elif cells.tail is None:
+            cells.release(i)
+            return
+        elif k or (cells.chunk_size or List.default_chunk_size) > 1:
+            cells.release(i)
+            cells.pull()
+        else:
+            # nothing is buffered, read the element without storing it
+            try:
+                item = next(cells.tail)
+            except StopIteration:
+                cells.tail = None
+                return
+            if type(item) is not cells.item_class and not cells.checked:
+                cells.check((item,))
+            if cells.item_type is None:
+                cells.keep_type(item)
+            i += 1
+            cells.base = i
+            yield item
+
+
+class StreamConsumedError(Exception):
+    """Raised when reading elements of a stream that were already read.
+
+    See `List.stream`:meth:.
+
+    """
+
+
 class List(Sequence, Hask):
     """Statically typed lazy sequence datatype.
 
     See `L`:obj: for more information.
 
+    The type of a List whose elements are not yet evaluated is not resolved
+    by forcing the first element.  Instead, the List keeps a type variable
+    for its elements that is checked against every element when it's
+    actually produced.
+
+    A List may be a view of the storage of another one, starting at a given
+    position and optionally ending at another (see `uncons`:meth:).  Slices
+    with no step are views too.  The elements are shared: none of them is
+    copied, and the elements the view evaluates are also evaluated for the
+    other List.  Use `copy`:meth: to get a List with its own storage.
+
+    Iterating a List evaluates its elements `chunk_size`:attr: at a time.
+    Indexing and `len`:func: evaluate all the elements they need at once.
+
+    A List made a stream (see `stream`:meth:) doesn't keep the elements
+    already read, so it can be consumed in constant memory, but only once.
+
+    The elements of a virtual List, as arithmetic sequences and the results
+    of `~hask3.Data.List.repeat`:func:, `~hask3.Data.List.replicate`:func:
+    and `~hask3.Data.List.cycle`:func:, are computed from their positions.
+    Iterating, indexing or slicing it evaluates none of them, so it can be
+    consumed in constant memory any number of times.
+
     """
+    #: The default `chunk_size`:attr:.  Values greater than 1 make iteration
+    #: faster, but evaluate elements ahead of those actually used.
+    default_chunk_size = 1
+
     def __init__(self, head=None, tail=None):
-        from itertools import chain
         from hask3.lang.type_system import typeof
         from hask3.lang.hindley_milner import unify
+        item_class = None
         if head is not None:
             count = len(head)
             if count > 0:
                 fst = head[0]
-                i = 1
-                while i < count:
-                    unify(typeof(fst), typeof(head[i]))
-                    i += 1
-            self.__head = list(head)
+                cls = type(fst)
+                if _is_plain(cls) and set(map(type, head)) == {cls}:
+                    item_class = cls
+                else:
+                    i = 1
+                    while i < count:
+                        unify(typeof(fst), typeof(head[i]))
+                        i += 1
+            head = list(head)
+        else:
+            head = []
+        if isinstance(tail, _Virtual):
+            # the elements are known without evaluating them
+            virtual, tail = tail, iter(tail)
+            cells = _Cells(head, tail, virtual.item_class())
+            cells.virtual = virtual
+            cells.item_type = virtual.item_type()
+            cells.checked = True
+        else:
+            tail = None if tail is None else iter(tail)
+            cells = _Cells(head, tail, item_class)
+        self.__cells = cells
+        self.__start = 0
+        self.__stop = None
+
+    @classmethod
+    def __view(cls, cells, start, stop=None):
+        """Create a List on `cells` from the item `start` to `stop`.
+
+        If `stop` is None the view extends to the end of the storage.
+
+        """
+        res = cls.__new__(cls)
+        res.__cells = cells
+        res.__start = start
+        res.__stop = stop
+        return res
+
+    @property
+    def __head(self):
+        """The elements of the List evaluated so far."""
+        return self.__cells.slice(self.__start, self.__stop)
+
+    @property
+    def __is_evaluated(self):
+        cells, stop = self.__cells, self.__stop
+        if stop is not None and cells.end >= stop:
+            return True
+        elif cells.virtual is not None:
+            return cells.end == cells.size
         else:
-            self.__head = []
-        self.__is_evaluated = tail is None
-        self.__tail = chain([] if self.__is_evaluated else tail)
+            return cells.tail is None
 
     def __type__(self):
         from hask3.lang.type_system import typeof
         from hask3.lang.hindley_milner import TypeVariable, ListType
-        if len(self.__head) == 0:
-            if self.__is_evaluated:
-                return ListType(TypeVariable())
-            else:
-                self.__next()
-                return self.__type__()
+        cells = self.__cells
+        if cells.item_type is not None:
+            return ListType(cells.item_type)
+        elif cells.items or cells.front:
+            # the elements of all the views have the same type
+            return ListType(typeof(cells.first()))
+        elif cells.tail is None:
+            return ListType(TypeVariable())
         else:
-            return ListType(typeof(self[0]))
+            # Deferred check, the type variable is not generic (level 0)
+            # because it's bound to the type of the elements to come.
+            cells.item_type = TypeVariable(level=0)
+            return ListType(cells.item_type)
+
+    def __forced_type(self):
+        """Return the type of the List evaluating its first element.
+
+        The type of a concatenation is known without evaluating it.
+
+        """
+        cells = self.__cells
+        if type(cells.tail) is not _Concat:
+            cells.fill(1)
+        return self.__type__()
 
     def __next(self):
         """Evaluate the next element of the tail, and add it to the head."""
-        from hask3.lang.type_system import typeof
-        from hask3.lang.hindley_milner import unify
-        if self.__is_evaluated:
+        if not self.__cells.pull():
             raise StopIteration
+
+    def __evaluate(self, keep=None):
+        """Evaluate the entire List.
+
+        :param keep: the number of last elements a stream must keep, None to
+                     keep all of them.
+
+        """
+        if self.__stop is None:
+            self.__cells.evaluate(keep)
         else:
-            try:
-                next_iter = next(self.__tail)
-                if len(self.__head) > 0:
-                    unify(typeof(self[0]), typeof(next_iter))
-                self.__head.append(next_iter)
-            except StopIteration:
-                self.__is_evaluated = True
+            self.__cells.fill(self.__stop)
 
-    def __evaluate(self):
-        """Evaluate the entire List."""
-        while not self.__is_evaluated:
-            self.__next()
+    @classmethod
+    def cycle(cls, items, count=None):
+        """Return a virtual List repeating `items` over and over.
+
+        `items` is a tuple or a non-empty List, whose elements are evaluated
+        only when needed.  The List is infinite, unless a `count` of elements
+        is given.  See `hask3.Data.List.cycle`:func:.
+
+        """
+        return cls(tail=_Cycle(items, count))
+
+    def stream(self):
+        """Make the List a stream and return it.
+
+        A stream releases its elements as they are read: iterating it,
+        matching it against a cons pattern (see `uncons`:meth:), or indexing
+        it release the elements before the one being read.  Reading a
+        released element again raises `StreamConsumedError`:class:.  Like
+        iterators, streams have no `len`:func:.
+
+        The flag is kept by the storage of the List, so the views of the List
+        become streams too.  The functions in `hask3.Data.List`:mod: return
+        streams when their arguments are.
+
+        """
+        self.__cells.stream = True
+        return self
+
+    @property
+    def is_stream(self):
+        """True if the List is a stream (see `stream`:meth:)."""
+        return self.__cells.stream
+
+    def copy(self):
+        """Return a List with the same elements and storage of its own.
+
+        Views (including slices) share the storage of the List they come
+        from; this is the only way to get the evaluated elements copied.  The
+        elements not evaluated yet are still taken from this List when the
+        copy needs them.
+
+        """
+        if self.__is_evaluated:
+            return List(head=self.__head)
+        else:
+            return List(head=self.__head, tail=self.__rest())
+
+    @property
+    def chunk_size(self):
+        """The number of elements evaluated at once when iterating the List.
+
+        It's shared with the views of the List (see `uncons`:meth:).  Setting
+        it to None restores the `default_chunk_size`:attr:.
+
+        """
+        return self.__cells.chunk_size or List.default_chunk_size
+
+    @chunk_size.setter
+    def chunk_size(self, value):
+        if value is not None and (type(value) is not int or value < 1):
+            msg = f"Chunk size must be a positive integer; found {value!r}"
+            raise ValueError(msg)
+        self.__cells.chunk_size = value
+
+    def uncons(self, count=1):
+        """Split the first `count` elements off the List.
+
+        Only those elements are evaluated.  The rest of the List is a view
+        sharing the storage of this one, nothing is copied.
+
+        :returns: a pair of a Python list with the first `count` elements and
+                  the List with the rest, or None if the List is shorter.
+
+        """
+        cells, start, end = self.__cells, self.__start, self.__stop
+        stop = start + count
+        if cells.stream:
+            cells.release(start)
+        if end is not None and stop > end:
+            return None
+        virtual = cells.virtual
+        if virtual is not None and cells.end <= start and not cells.stream:
+            # computed, not evaluated
+            size = cells.size
+            if size is not None and stop > size:
+                return None
+            head = [virtual.get(p) for p in range(start, stop)]
+            return head, self.__view(cells, stop, end)
+        elif cells.fill(stop) < stop:
+            return None
+        else:
+            return cells.slice(start, stop), self.__view(cells, stop, end)
 
     def __rxor__(self, item):
-        """``^`` is the ``cons`` operator (equivalent to ``:`` in Haskell)."""
+        """``^`` is the ``cons`` operator (equivalent to ``:`` in Haskell).
+
+        When the List starts at the first element of its storage, the new
+        element is put in front of the storage and the result is a view of
+        it, nothing is copied.  Consing a different element onto the same
+        List again copies its evaluated elements.
+
+        """
         from hask3.lang.type_system import typeof
         from hask3.lang.hindley_milner import ListType, unify
-        unify(self.__type__(), ListType(typeof(item)))
-        if self.__is_evaluated:
-            return List(head=[item] + self.__head)
-        return List(head=[item] + self.__head, tail=self.__tail)
+        cells, start = self.__cells, self.__start
+        cls = type(item)
+        if cls is not cells.item_class:
+            unify(self.__forced_type(), ListType(typeof(item)))
+            if cells.item_class is None and _is_plain(cls):
+                cells.item_class = cls
+        with _CONS_LOCK:
+            front = cells.front
+            prepend = start == -len(front)
+            if prepend:
+                front.append(item)
+        if prepend:
+            return self.__view(cells, start - 1, self.__stop)
+        elif self.__is_evaluated:
+            res = List(head=[item] + self.__head)
+        else:
+            res = List(head=[item] + self.__head, tail=self.__rest())
+        res.__cells.stream = cells.stream
+        return res
+
+    def __rest(self):
+        """Iterate the elements of the List not evaluated yet."""
+        cells = self.__cells
+        start = max(self.__start, cells.end)
+        iter_cells = _iter_stream if cells.stream else _iter_cells
+        return iter_cells(cells, start, self.__stop)
 
     def __add__(self, other):
         """``(+) :: [a] -> [a] -> [a]``
@@ -244,22 +1058,105 @@ class List(Sequence, Hask):
         Haskell and + for Python lists
 
         """
-        from itertools import chain
         from hask3.lang.type_system import typeof
         from hask3.lang.hindley_milner import unify
-        unify(self.__type__(), typeof(other))
-        if self.__is_evaluated and other.__is_evaluated:
-            return List(head=self.__head + other.__head)
-        elif self.__is_evaluated and not other.__is_evaluated:
-            return List(head=self.__head + other.__head, tail=other.__tail)
+        cells = self.__cells
+        res_type = self.__forced_type()
+        if isinstance(other, List):
+            unify(res_type, other.__forced_type())
+            if other.__is_empty():
+                return self
+            elif self.__is_empty():
+                return other
+            checked = True
+            same_class = other.__cells.item_class is cells.item_class
+            stream = cells.stream or other.__cells.stream
+        else:
+            unify(res_type, typeof(other))
+            checked = same_class = False
+            stream = cells.stream
+        # Nothing is copied or evaluated: the result is a new rope node.  The
+        # segments of operands that are ropes are spliced, so that ropes are
+        # never nested.
+        rope = self.__rope()
+        if rope is None:
+            tail = _Concat(None, self)
+        elif rope[0]:
+            tail = _Concat(_Concat(None, List(head=rope[0])), rope[1])
+        else:
+            tail = rope[1]
+        rope = other.__rope() if isinstance(other, List) else None
+        if rope is None:
+            tail = _Concat(tail, other)
         else:
-            return List(head=self.__head, tail=chain(self.__tail, other))
+            if rope[0]:
+                tail = _Concat(tail, List(head=rope[0]))
+            tail = _Concat(tail, rope[1])
+        res = _Cells([], tail, cells.item_class if same_class else None)
+        res.item_type = res_type.types[0]
+        res.checked = checked
+        res.stream = stream
+        return self.__view(res, 0)
+
+    def __rope(self):
+        """Return the List as a rope, if it's a whole concatenation.
+
+        :returns: a pair of a Python list with the elements consed in front of
+                  the rope and the rope (a `_Concat`:class:), or None if the
+                  List is not a concatenation or a view of part of one.
+
+        """
+        cells, start = self.__cells, self.__start
+        tail = cells.tail
+        if type(tail) is _Concat and start <= 0 and self.__stop is None \
+           and not cells.stream:
+            return cells.slice(start, 0), tail
+        else:
+            return None
+
+    def __is_empty(self):
+        """Tell if the List is evaluated and has no elements."""
+        return self.__is_evaluated and self.__length() == 0
+
+    def __settle(self):
+        """Evaluate the elements of the List that are already known.
+
+        Those are the elements of a bounded view, which were evaluated when
+        slicing copied them, and those of the leading evaluated segments of
+        a concatenation.  The elements of a virtual List are never evaluated.
+
+        """
+        cells = self.__cells
+        if cells.virtual is not None:
+            return
+        elif self.__stop is not None:
+            cells.fill(self.__stop)
+        elif type(cells.tail) is _Concat:
+            count = 0
+            for segment in cells.tail.segments():
+                if isinstance(segment, List):
+                    segment.__settle()
+                    if segment.__is_evaluated:
+                        count += segment.__length()
+                        continue
+                cells.fill(count)
+                break
+            else:
+                cells.evaluate()
 
     def __str__(self):
         from hask3.lang.typeclasses import show
-        body = ", ".join(map(show, self.__head))
-        if self.__is_evaluated:
-            if len(self.__head) <= 1:
+        self.__settle()
+        cells = self.__cells
+        if cells.virtual is not None and (cells.size is not None or
+                                          self.__stop is not None):
+            # shown from the descriptor, the elements are not stored
+            head, evaluated = list(iter(self)), True
+        else:
+            head, evaluated = self.__head, self.__is_evaluated
+        body = ", ".join(map(show, head))
+        if evaluated:
+            if len(head) <= 1:
                 body = f'[{body}]'
             suffix = ''
         else:
@@ -269,44 +1166,20 @@ class List(Sequence, Hask):
     def __cmp__(self, other):
         if self.__is_evaluated and other.__is_evaluated:
             return cmp(self.__head, other.__head)
-
-        elif len(self.__head) >= len(other.__head):
-            # check the evaluated heads
-            heads = zip(self.__head[:len(other.__head)], other.__head)
-            heads_comp = ((cmp(h1, h2) for h1, h2 in heads))
-            for comp in heads_comp:
-                if comp != 0:
-                    return comp
-
-            # evaluate the shorter-headed list until it is the same size
-            while len(self.__head) > len(other.__head):
-                if other.__is_evaluated:
+        else:
+            # compare the elements in order, evaluating no more than needed
+            items = iter(other)
+            for x in self:
+                for y in items:
+                    comp = cmp(x, y)
+                    if comp != 0:
+                        return comp
+                    break
+                else:
                     return 1
-                other.__next()
-                comp = cmp(self.__head[len(other.__head)-1], other.__head[-1])
-                if comp != 0:
-                    return comp
-
-            # evaluate the tails, checking each time
-            while not self.__is_evaluated or not other.__is_evaluated:
-                if not self.__is_evaluated:
-                    self.__next()
-                if not other.__is_evaluated:
-                    other.__next()
-
-                len_comp = cmp(len(self.__head), len(other.__head))
-                if len_comp != 0:
-                    return len_comp
-
-                if len(self.__head) > 0:
-                    value_comp = cmp(self.__head[-1], other.__head[-1])
-                    if value_comp != 0:
-                        return value_comp
-
-        elif len(other.__head) > len(self.__head):
-            return -other.__cmp__(self)
-
-        return 0
+            for _ in items:
+                return -1
+            return 0
 
     def __eq__(self, other):
         return self.__cmp__(other) == 0
@@ -326,21 +1199,57 @@ class List(Sequence, Hask):
         return comp in (1, 0)
 
     def __len__(self):
-        self.__evaluate()
-        return len(self.__head)
+        if self.__cells.stream:
+            # len() would consume the stream, and list() calls it
+            raise TypeError("A stream has no len(), use Data.List.length")
+        end = self.__cells.size
+        if end is None:
+            self.__evaluate()
+        return self.__length(end)
 
-    def __iter__(self):
-        for item in self.__head:
-            yield item
+    def __length(self, end=None):
+        """Return the length of the List, given the `end` of its storage.
 
-        for item in self.__tail:
-            self.__head.append(item)
-            yield item
+        If `end` is None, the List must be evaluated.
+
+        """
+        stop = self.__stop
+        if end is None:
+            end = self.__cells.end
+        if stop is not None and stop < end:
+            end = stop
+        return max(0, end - self.__start)
+
+    def closed_sum(self):
+        """Return the sum of a finite virtual List of `int` in closed form.
+
+        Return None for the other Lists, whose elements must be added one by
+        one.  See `hask3.Data.List.sum`:func:.
+
+        """
+        cells, start = self.__cells, self.__start
+        virtual = cells.virtual
+        if virtual is not None and start >= 0:
+            end = cells.size
+            if end is not None:
+                stop = start + self.__length(end)
+                virtual = virtual.slice(range(start, stop))
+                res = NotImplemented if virtual is None else virtual.sum()
+                if res is not NotImplemented:
+                    return res
+        return None
+
+    def __iter__(self):
+        cells = self.__cells
+        iter_cells = _iter_stream if cells.stream else _iter_cells
+        return iter_cells(cells, self.__start, self.__stop)
 
     def count(self, x):
         from hask3.lang.type_system import typeof
         from hask3.lang.hindley_milner import ListType, unify
         unify(self.__type__(), ListType(typeof(x)))
+        if self.__cells.stream:
+            return sum(1 for y in self if y == x)
         self.__evaluate()
         return self.__head.count(x)
 
@@ -348,6 +1257,11 @@ class List(Sequence, Hask):
         from hask3.lang.type_system import typeof
         from hask3.lang.hindley_milner import ListType, unify
         unify(self.__type__(), ListType(typeof(x)))
+        if self.__cells.stream:
+            for i, y in enumerate(self):
+                if y == x:
+                    return i
+            raise ValueError(f"{x!r} is not in List")
         self.__evaluate()
         return self.__head.index(x)
 
@@ -356,36 +1270,128 @@ class List(Sequence, Hask):
         from hask3.lang.type_system import typeof
         from hask3.lang.hindley_milner import ListType, unify
         unify(self.__type__(), ListType(typeof(x)))
+        virtual, start = self.__cells.virtual, self.__start
+        if virtual is not None and start >= 0:
+            res = virtual.contains(x, start, self.__stop)
+            if res is not NotImplemented:
+                return res
         return isin(x, iter(self))
 
     def __getitem__(self, ix):
-        is_slice = isinstance(ix, slice)
-        if is_slice:
-            i = ix.start if ix.stop is None else ix.stop
+        if type(ix) is int:
+            cells, stop = self.__cells, self.__stop
+            items, virtual = cells.items, cells.virtual
+            if ix >= 0:
+                j = self.__start + ix
+                end = cells.end
+                if stop is not None and j >= stop:
+                    raise IndexError("List index out of range")
+                elif virtual is not None:
+                    pass
+                elif j == end:
+                    cells.pull()
+                elif j > end:
+                    cells.fill(j + 1)
+            else:
+                end = cells.size
+                if end is None:
+                    self.__evaluate(keep=-ix)
+                    end = cells.end
+                j = (end if stop is None else min(stop, end)) + ix
+            if virtual is not None and j >= cells.end and j >= self.__start:
+                # computed, not evaluated
+                if virtual.count is None or j < virtual.count:
+                    return virtual.get(j)
+                else:
+                    raise IndexError("List index out of range")
+            base = cells.base
+            if self.__start <= j < base + len(items):
+                if j < 0 and not base:
+                    return cells.front[-1 - j]
+                elif j < base:
+                    raise cells.consumed(j)
+                elif cells.stream:
+                    cells.release(j)
+                    return items[j - cells.base]
+                else:
+                    return items[j - base]
+            else:
+                raise IndexError("List index out of range")
+        elif isinstance(ix, slice):
+            if ix.step is None or ix.step == 1:
+                return self.__slice(ix.start, ix.stop)
+            else:
+                return self.__stride(ix)
         else:
-            i = ix
-        # make sure that the list is evaluated enough to do the indexing, but
-        # not any more than necessary
-        # if index is negative, evaluate the entire list
-        if i is None:
-            # In Python 3, `None >= 0` is a TypeError, but in Python 2 returns
-            # False.  So let's go negative in any case...
-            i = -1
-        if i >= 0:
-            while (i+1) > len(self.__head):
-                try:
-                    self.__next()
-                except StopIteration:
-                    break
+            from operator import index
+            return self[index(ix)]
+
+    def __slice(self, i, j):
+        """Return the view of the List from the item `i` to `j`.
+
+        Nothing is evaluated unless some of the bounds are negative, in which
+        case the entire List is evaluated to know its length.  A bounded slice
+        of a virtual List is a virtual List of its own, whose elements are
+        computed when needed.
+
+        """
+        cells = self.__cells
+        start, stop = self.__start, self.__stop
+        if (i is not None and i < 0) or (j is not None and j < 0):
+            end = cells.size
+            if end is None:
+                self.__evaluate(-i if i is not None and i < 0 else None)
+            i, j, _ = slice(i, j).indices(self.__length(end))
+            j = max(i, j)
+        if i is not None:
+            start += i
+        if j is not None:
+            j += self.__start
+            stop = j if stop is None else min(stop, j)
+        if stop is not None and stop < start:
+            stop = start
+        virtual = cells.virtual
+        if virtual is not None and stop is not None and start >= 0 and \
+           not cells.stream:
+            end = cells.size
+            positions = range(start, stop if end is None else min(stop, end))
+            if not positions:
+                return List()
+            res = virtual.slice(positions)
+            if res is not None:
+                return List(tail=res)
+        return self.__view(cells, start, stop)
+
+    def __stride(self, ix):
+        """Return a new List with the items of the extended slice `ix`.
+
+        The List is evaluated only up to the farthest non-negative bound.
+
+        """
+        i, j = ix.start, ix.stop
+        cells = self.__cells
+        if cells.virtual is not None and self.__start >= 0:
+            end = cells.size
+            if end is not None:
+                start = self.__start
+                positions = range(start, start + self.__length(end))[ix]
+                if not positions:
+                    return List()
+                return List(tail=cells.virtual.slice(positions))
+        if ix.step > 0 and j is not None and j >= 0 and (i or 0) >= 0:
+            count = j
+        elif ix.step < 0 and i is not None and i >= 0 and (j or 0) >= 0:
+            count = i + 1
         else:
+            count = None
+        if count is None:
             self.__evaluate()
-        if is_slice:
-            if ix.stop is None and not self.__is_evaluated:
-                return List(head=self.__head[ix], tail=self.__tail)
-            else:
-                return List(head=self.__head[ix])
         else:
-            return self.__head[i]
+            stop = self.__start + count
+            if self.__stop is not None:
+                stop = min(stop, self.__stop)
+            self.__cells.fill(stop)
+        return List(head=self.__head[ix])
 
 
 # Basic typeclass instances for list
@@ -439,10 +1445,24 @@ class L(Syntax):
         >>> L[1] == L[[1]]
         True
 
+    ``L.stream[...]`` takes the same input and returns a stream, a List that
+    doesn't keep the elements already read (see `List.stream`:meth:).  A
+    List given to it is made a stream itself.
+
     """
 
     invalid_syntax_message = "Invalid input to list constructor"
 
+    @objectify
+    class stream(Syntax):
+        """Syntax to create streams, ``L.stream[...]``."""
+
+        invalid_syntax_message = "Invalid input to stream constructor"
+
+        def __getitem__(self, lst):
+            from hask3.lang.lazylist import L, List
+            return (lst if isinstance(lst, List) else L[lst]).stream()
+
     def __getitem__(self, lst):
         from collections.abc import Sequence
         from hask3.hack import isin, is_iterator
@@ -469,6 +1489,6 @@ class L(Syntax):
             return List(head=[lst])
 
 
-del Sequence, objectify
+del ABC, abstractmethod, Sequence, Lock, objectify
 del Typeclass, Hask, Show, Eq, Ord
 del Syntax, instance, sig, H
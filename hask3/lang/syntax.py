@@ -1,7 +1,8 @@
 import sys
-from hask3.hack import objectify, settle_magic_methods
+from hask3.hack import objectify, settle_magic_methods, context_local
 from hask3.lang.type_system import PatternMatchBind
 from hask3.lang.type_system import PatternMatchListBind
+from hask3.lang.type_system import CompiledPattern
 from hask3.lang.type_system import Undefined
 
 from hask3.lang.type_system import PyFunc as func    # noqa
@@ -149,18 +150,34 @@ class sig(Syntax):
 
     See `H`:obj: special object, and `t`:func: function for more information.
 
+    The optional `typecheck` argument ('full', 'sampled' or 'off') and
+    `sample_rate` fix the type-checking mode of the function, overriding the
+    one of the `~hask3.lang.type_system.typecheck`:class: context manager::
+
+        @sig(H/ int >> int >> int, typecheck='off')
+        def fast_add(x, y):
+            return x + y
+
     """
 
     invalid_syntax_message = "Syntax error in type signature"
 
-    def __init__(self, signature):
+    def __init__(self, signature, typecheck=None, sample_rate=None):
         from hask3.lang.type_system import build_sig, make_fn_type
+        from hask3.lang.type_system import build_checkers, _typecheck_policy
+        if typecheck is not None:
+            self.typecheck = _typecheck_policy(typecheck, sample_rate)
+        elif sample_rate is not None:
+            raise ValueError("sample_rate requires typecheck='sampled'")
+        else:
+            self.typecheck = None
         if isinstance(signature, __signature__):
             if len(signature.sig.args) >= 2:
                 super().__init__()
                 self.sig = signature.sig
                 self.fn_args = fn_args = build_sig(self.sig)
                 self.fn_type = make_fn_type(fn_args)
+                self.checkers = build_checkers(self.fn_type, len(fn_args))
             else:
                 raise SyntaxError("Not enough type arguments in signature")
         else:
@@ -175,7 +192,8 @@ class sig(Syntax):
 
     def __call__(self, fn):
         from hask3.lang.type_system import TypedFunc
-        res = TypedFunc(fn, self.fn_args, self.fn_type)
+        res = TypedFunc(fn, self.fn_args, self.fn_type, self.typecheck,
+                        checkers=self.checkers)
         res.haskell_sig = self
         return res
 
@@ -227,7 +245,7 @@ def typify(fn, hkt=None):
 
 
 @objectify
-@settle_magic_methods(lambda self, *args: Undefined())
+@settle_magic_methods(lambda self, *args: undefined)
 class undefined(Undefined):
     """Undefined value with special syntactic powers.
 
@@ -240,42 +258,144 @@ class undefined(Undefined):
     pass
 
 
+class lazy(Syntax):
+    """A body of a `caseof`:class: or `guard`:class: line evaluated on demand.
+
+    The thunk is called only if its line is the first one that matches, so
+    the other lines do not evaluate their bodies against `undefined`:obj:::
+
+        ~(caseof(x)
+            | m(0)   >> 1
+            | m(1)   >> 1
+            | m(m.n) >> lazy(lambda: fib(p.n - 1) + fib(p.n - 2)))
+
+    ``p.*`` in the thunk refers to the names bound by the line.
+
+    :param thunk: a callable with no arguments returning the value.
+
+    """
+
+    invalid_syntax_message = "Syntax error in lazy expression"
+
+    def __init__(self, thunk):
+        if callable(thunk):
+            self.thunk = thunk
+            super().__init__()
+        else:
+            raise ValueError("Lazy expression must be callable")
+
+
 # Constructs for pattern matching.
-# Note that the approach implemented here uses lots of global state and is
-# pretty much the opposite of "functional" or "thread-safe."
+# The bound variables live in a stack local to the current thread or asyncio
+# task (see `MatchStack`:class:).
 
 class IncompletePatternError(Exception):
     pass
 
 
 class MatchStackFrame:
-    """One stack frame for pattern matching bound variable stack."""
-    def __init__(self, value):
+    """One stack frame for pattern matching bound variable stack.
+
+    :param owner: the expression the frame belongs to.  Only a weak reference
+           is kept: once the expression is garbage the frame is stale.
+
+    """
+    from weakref import ref as _ref
+
+    def __init__(self, value, owner=None):
         self.value = value
         self.cache = {}
         self.matched = False
+        self.owner = None if owner is None else self._ref(owner)
+
+    @property
+    def stale(self):
+        """Whether the expression of the frame is gone.
+
+        It happens when evaluating a line raised an exception, so the frame
+        was never popped.
+
+        """
+        return self.owner is not None and self.owner() is None
 
 
 class MatchStack:
-    """Stack for storing locally bound variables from matches."""
-    from collections import deque
-    __stack__ = deque()
-    del deque
+    """Stack for storing locally bound variables from matches.
+
+    The stack is local to the current context: every thread and asyncio task
+    sees its own stack, so pattern matching can run concurrently.  It is
+    stored as an immutable linked list, ``(frame, parent)`` pairs ending with
+    ``()``, that a task copying the context can not change for its parent.
+
+    """
+    __stack__ = context_local('hask3.MatchStack', ())
 
     @classmethod
-    def push(cls, value):
-        """Push a new frame onto the stack, representing a new case expr."""
-        cls.__stack__.append(MatchStackFrame(value))
+    def push(cls, value, owner=None):
+        """Push a new frame onto the stack, representing a new case expr.
+
+        :param owner: the expression the frame belongs to, see
+               `MatchStackFrame`:class:.
+
+        :returns: the new frame.
+
+        """
+        frame = MatchStackFrame(value, owner)
+        stack = cls.__stack__.get()
+        if stack and stack[0].stale:
+            stack = cls.__live()
+        cls.__stack__.set((frame, stack))
+        return frame
 
     @classmethod
-    def pop(cls):
-        """Pop the current frame off the stack."""
-        cls.__stack__.pop()
+    def pop(cls, frame=None):
+        """Pop the current frame off the stack.
+
+        If `frame` is given, pop it together with the frames above it.  They
+        were left by expressions that raised an exception.
+
+        """
+        stack = cls.__stack__.get()
+        if frame is None:
+            stack = cls.__live()
+        else:
+            while stack and stack[0] is not frame:
+                stack = stack[1]
+        cls.__stack__.set(stack[1])
 
     @classmethod
     def get_frame(cls):
         """Access the current frame."""
-        return cls.__stack__[-1]
+        frame = cls.__stack__.get()[0]
+        if frame.owner is not None and frame.owner() is None:
+            frame = cls.__live()[0]
+        return frame
+
+    @classmethod
+    def depth(cls):
+        """Return the number of frames in the stack of the current context.
+
+        Stale frames at the top of the stack are discarded first.  Outside
+        of a ``caseof`` expression the depth should be 0; a growing depth
+        reveals frames that are never popped.
+
+        """
+        res = 0
+        stack = cls.__live()
+        while stack:
+            res += 1
+            stack = stack[1]
+        return res
+
+    @classmethod
+    def __live(cls):
+        """Discard the stale frames at the top of the stack and return it."""
+        stack = origin = cls.__stack__.get()
+        while stack and stack[0].stale:
+            stack = stack[1]
+        if stack is not origin:
+            cls.__stack__.set(stack)
+        return stack
 
     @classmethod
     def get_name(cls, name):
@@ -299,9 +419,13 @@ class m(Syntax):
 
     def __call__(self, pattern):
         from hask3.lang.type_system import pattern_match
-        is_match, env = pattern_match(MatchStack.get_frame().value, pattern)
-        if is_match and not MatchStack.get_frame().matched:
-            MatchStack.get_frame().cache = env
+        frame = MatchStack.get_frame()
+        if frame.matched:
+            # A previous line matched, the rest are not tested.
+            return __match_test__(False)
+        is_match, env = pattern_match(frame.value, pattern)
+        if is_match:
+            frame.cache = env
         return __match_test__(is_match)
 
 
@@ -354,15 +478,42 @@ class __pattern_bind__(Syntax, PatternMatchBind):
             raise SyntaxError(self.invalid_syntax_message)
 
 
+class pattern(Syntax, CompiledPattern):
+    """A pattern compiled once, for example at module level.
+
+    It can be given to `m`:obj: (alone or inside another pattern) and to
+    `cases`:class:.  Matching it does not build the pattern again, so
+    neither the bind objects nor the data constructor (and its type check)
+    are created on each evaluation::
+
+        Just_a = pattern(Just(m.a))
+
+        def fmap(f, x):
+            return ~(caseof(x)
+                        | m(Just_a)  >> lazy(lambda: Just(f(p.a)))
+                        | m(Nothing) >> Nothing)
+
+    :raises SyntaxError: if a variable name is used multiple times in the
+        pattern.
+
+    """
+
+    invalid_syntax_message = "Syntax error in compiled pattern"
+
+    def __init__(self, pattern):
+        CompiledPattern.__init__(self, pattern)
+
+
 class __match_line__(Syntax):
     """One line of a caseof expression.
 
     i.e.: ``m( ... ) >> return_value``.
 
     """
-    def __init__(self, is_match, return_value):
+    def __init__(self, is_match, return_value, env=None):
         self.is_match = is_match
         self.return_value = return_value
+        self.env = env
 
 
 class __match_test__(Syntax):
@@ -375,8 +526,12 @@ class __match_test__(Syntax):
         self.is_match = is_match
 
     def __rshift__(self, value):
-        MatchStack.get_frame().cache = {}
-        return __match_line__(self.is_match, value)
+        frame = MatchStack.get_frame()
+        env, frame.cache = frame.cache, {}
+        if self.is_match and isinstance(value, lazy):
+            return __match_line__(True, value, env)
+        else:
+            return __match_line__(self.is_match, value)
 
 
 class __unmatched_case__(Syntax):
@@ -386,16 +541,19 @@ class __unmatched_case__(Syntax):
     been found.
 
     """
+    #: The frame pushed by the expression, None for an undefined value.
+    frame = None
+
     def __or__(self, line):
         if line.is_match:
-            MatchStack.get_frame().matched = True
-            return __matched_case__(line.return_value)
+            (self.frame or MatchStack.get_frame()).matched = True
+            return __matched_case__(line.return_value, line.env, self)
         return self
 
     def __invert__(self):
-        value = MatchStack.get_frame().value
-        MatchStack.pop()
-        raise IncompletePatternError(value)
+        frame = self.frame or MatchStack.get_frame()
+        MatchStack.pop(self.frame)
+        raise IncompletePatternError(frame.value)
 
 
 class __matched_case__(Syntax):
@@ -404,15 +562,28 @@ class __matched_case__(Syntax):
     When one or more lines have been tested and after a match has been found.
 
     """
-    def __init__(self, return_value):
+    def __init__(self, return_value, env=None, case=None):
         self.value = return_value
+        self.env = env
+        # Keeps the expression, and so its frame, alive until `~`.
+        self.case = case
 
     def __or__(self, line):
         return self
 
     def __invert__(self):
-        MatchStack.pop()
-        return self.value
+        frame = getattr(self.case, 'frame', None)
+        if isinstance(self.value, lazy):
+            # The bindings of the matched line are visible to the thunk.
+            current = frame or MatchStack.get_frame()
+            current.cache, current.matched = self.env, False
+            try:
+                return self.value.thunk()
+            finally:
+                MatchStack.pop(frame)
+        else:
+            MatchStack.pop(frame)
+            return self.value
 
 
 class caseof(__unmatched_case__):
@@ -437,13 +608,58 @@ class caseof(__unmatched_case__):
                         | m(1)   >> 1
                         | m(m.n) >> fib(p.n - 1) + fib(p.n - 2))
 
-    See `m`:obj: and `p`:obj: special pattern matching constructions.
+    See `m`:obj: and `p`:obj: special pattern matching constructions, and
+    `lazy`:class: for bodies evaluated only if their line matches.
 
     """
     def __init__(self, value):
         if isinstance(value, Undefined):
             return
-        MatchStack.push(value)
+        self.frame = MatchStack.push(value, self)
+
+
+class cases(Syntax):
+    """Compiled pattern matching.
+
+    The patterns are compiled into a decision table once, when the object is
+    created; see `~hask3.lang.type_system.PatternTable`:class:.  Each line is
+    a pair of a pattern and a function for its body.  Calling the object with
+    a value (followed by any extra arguments) calls the body of the first
+    matching line with the extra arguments and then the bound variables, in
+    the order they appear in the pattern.  The wildcard ``m._`` doesn't bind
+    a value.
+
+    Usage::
+
+        fib_cases = cases(
+            (0,   lambda: 1),
+            (1,   lambda: 1),
+            (m.n, lambda n: fib(n - 1) + fib(n - 2)))
+
+        @sig(H/ int >> int)
+        def fib(x):
+            return fib_cases(x)
+
+    :raises IncompletePatternError: if no line matches the value.
+
+    """
+
+    invalid_syntax_message = "Syntax error in compiled cases"
+
+    def __init__(self, *lines):
+        from hask3.lang.type_system import PatternTable
+        self.table = PatternTable([pat for pat, _ in lines])
+        self.bodies = [body for _, body in lines]
+
+    def __call__(self, value, *args):
+        if isinstance(value, Undefined):
+            return value
+        res = self.table.match(value)
+        if res is not None:
+            index, binds = res
+            return self.bodies[index](*args, *binds)
+        else:
+            raise IncompletePatternError(value)
 
 
 # ADT creation syntax ("data" expressions)
@@ -921,7 +1137,10 @@ class __matched_guard__(__guard_base__):
             raise SyntaxError(self.invalid_syntax_message)
 
     def __invert__(self):
-        return self.value
+        if isinstance(self.value, lazy):
+            return self.value.thunk()
+        else:
+            return self.value
 
 
 class guard(__unmatched_guard__):
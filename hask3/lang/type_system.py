@@ -3,9 +3,9 @@
 Defining `instances of typeclasses <hask3.lang.syntax.instance>`:class: will
 store a internal mapping on every `~hask3.lang.typeclasses.Typeclass`:class:
 (`__instances__` ) using a unique key for every new type generated by
-`Typeclass.get_id`:meth: static method.  The corresponding values are special
-`named-tuples <namedtuple>`:class: containing the member functions being added
-(see `build_instance`:func: function.)
+`Typeclass.get_id`:meth: static method.  The corresponding values are
+`instance records <InstanceRecord>`:class: containing the member functions
+being added (see `build_instance`:func: function.)
 
 In the next example, the `Eq` typeclass is added to the type `Person` by
 implementing the member function `eq`::
@@ -21,14 +21,9 @@ implementing the member function `eq`::
 
 '''
 
-from hask3.lang.hindley_milner import show_type as _str_of
-
+from collections import namedtuple
 
-def _name_of(who):
-    res = _str_of(who)
-    if not res.isidentifier():
-        res = ''.join(c for c in res if c.isalnum() or (c == '_'))
-    return res
+from hask3.lang.hindley_milner import show_type as _str_of
 
 
 class TypeMeta(type):
@@ -37,32 +32,58 @@ class TypeMeta(type):
     Ensures that all typeclasses are instantiated with a dictionary to map
     instances to their member functions, and a list of dependencies.
 
+    Instance lookups (``Typeclass[item]``) are cached by the class of the
+    item in `__dispatch__`, including the misses.  `build_instance`:func:
+    clears the cache of the typeclass.
+
     """
 
     def __init__(self, *args):
         super().__init__(*args)
         self.__instances__ = {}
+        self.__dispatch__ = {}
+        self.__methods__ = {}
         # excl self, Typeclass, object
         self.__dependencies__ = self.mro()[1:-2]
 
     def __getitem__(self, item):
-        from hask3.lang.hindley_milner import ListType
-        try:
-            if isinstance(item, ADT):
-                key = item.__type_constructor__
-            elif isinstance(typeof(item), ListType):
-                key = type(item)
-            elif isinstance(item, Hask):
-                key = typeof(item)
-            elif isinstance(item, Exception):
-                key = Exception
-            else:
-                key = type(item)
-            return self.__instances__[self.get_id(key)]
-        except KeyError:
+        res = self.__dispatch__.get(type(item))
+        if res is None:
+            key, cacheable = _instance_key(item)
+            res = self.__instances__.get(self.get_id(key), _NO_INSTANCE)
+            if cacheable:
+                self.__dispatch__[type(item)] = res
+        if res is not _NO_INSTANCE:
+            return res
+        else:
             raise TypeError(f"No instance for {item}")
 
 
+#: Cached result of a typeclass lookup without instance.
+_NO_INSTANCE = object()
+
+
+def _instance_key(item):
+    """Return the key to find the instances for `item`.
+
+    Also tell if the key only depends on the class of the item.
+
+    """
+    from hask3.lang.hindley_milner import ListType
+    if isinstance(item, ADT):
+        return item.__type_constructor__, True
+    elif isinstance(item, Hask):
+        res = typeof(item)
+        if isinstance(res, ListType):
+            return type(item), True
+        else:
+            return res, False
+    elif isinstance(item, Exception):
+        return Exception, True
+    else:
+        return type(item), True
+
+
 class Typeclass(metaclass=TypeMeta):
     """Base class for Hask type-classes.
 
@@ -84,6 +105,22 @@ class Typeclass(metaclass=TypeMeta):
     def derive_instance(typeclass, type_):
         raise NotImplementedError("Typeclasses must implement derive_instance")
 
+    @classmethod
+    def method(typeclass, name, value):
+        """Return the member function `name` of the instance for `value`.
+
+        Equivalent to ``getattr(typeclass[value], name)``, but the result is
+        cached by the class of `value` and `name`.
+
+        """
+        key = (type(value), name)
+        res = typeclass.__methods__.get(key)
+        if res is None:
+            res = getattr(typeclass[value], name)
+            if key[0] in typeclass.__dispatch__:    # class-based lookup
+                typeclass.__methods__[key] = res
+        return res
+
     @staticmethod
     def get_id(key):
         '''Get the unique ID to obtain 'instance' member functions.'''
@@ -129,17 +166,52 @@ def build_instance(typeclass, cls, attrs):
             super-classes.
 
     """
-    from collections import namedtuple
     deps = typeclass.__dependencies__
     key = Typeclass.get_id(cls)
     bad = next((dep for dep in deps if key not in dep.__instances__), None)
     if bad is None:
-        name = f'__{typeclass.__name__}_{_name_of(cls)}__'
-        typeclass.__instances__[key] = namedtuple(name, attrs.keys())(**attrs)
+        record = InstanceRecord.subclass(typeclass, attrs.keys())
+        typeclass.__instances__[key] = record(**attrs)
+        typeclass.__dispatch__.clear()
+        typeclass.__methods__.clear()
     else:
         raise TypeError(f"Missing dependency: '{bad.__name__}'")
 
 
+class InstanceRecord:
+    """Base class for the member functions of typeclass instances.
+
+    There is one subclass, with a slot per member function, for each
+    typeclass and set of member names (see `subclass`:meth:).
+
+    """
+    __slots__ = ()
+
+    __subclasses = {}
+
+    def __init__(self, **attrs):
+        for name, value in attrs.items():
+            setattr(self, name, value)
+
+    def __repr__(self):
+        cls = type(self)
+        attrs = ', '.join(f'{name}={getattr(self, name)!r}'
+                          for name in cls.__slots__)
+        return f'{cls.__name__}({attrs})'
+
+    @classmethod
+    def subclass(cls, typeclass, names):
+        """Get the record class for `typeclass` with members `names`."""
+        names = tuple(names)
+        key = (typeclass, names)
+        res = cls.__subclasses.get(key)
+        if res is None:
+            name = f'__{typeclass.__name__}__'
+            res = type(name, (cls, ), {'__slots__': names})
+            res = cls.__subclasses.setdefault(key, res)
+        return res
+
+
 def has_instance(cls, typeclass):
     """Test whether a class is a member of a particular type-class.
 
@@ -201,20 +273,44 @@ def typeof(obj):
               `~hask3.lang.hindley_milner.TypeVariable`:class:).
 
     """
-    from hask3.hack import is_python_function
-    from hask3.lang.hindley_milner import TypeVariable, TypeOperator, Tuple
+    from hask3.lang.hindley_milner import TypeVariable
     # XXX: WTF?
     TypeVariable.next_var_name = 'a'
+    cls = type(obj)
+    res = _typeof_dispatch.get(cls)
+    if res is None:
+        res = _typeof_dispatch.setdefault(cls, _typeof_handler(obj))
+    return res(obj)
+
+
+def _typeof_handler(obj):
+    """Return the function that gets the type of `obj` and its class."""
+    from hask3.hack import is_python_function
+    from hask3.lang.hindley_milner import ground
     if isinstance(obj, Hask):
-        return obj.__type__()
+        return _typeof_hask
     elif isinstance(obj, tuple):
-        return Tuple([typeof(o) for o in obj])
-    elif obj is None:
-        return TypeOperator(None, [])
-    elif is_python_function(obj):
-        return TypeOperator(PyFunc, [])
+        return _typeof_tuple
     else:
-        return TypeOperator(type(obj), [])
+        if obj is None:
+            res = ground(None)
+        elif is_python_function(obj):
+            res = ground(PyFunc)
+        else:
+            res = ground(type(obj))
+        return lambda obj: res
+
+
+def _typeof_hask(obj):
+    return obj.__type__()
+
+
+def _typeof_tuple(obj):
+    from hask3.lang.hindley_milner import Tuple
+    return Tuple([typeof(o) for o in obj])
+
+
+_typeof_dispatch = {}
 
 
 # TODO: Implement string representation.
@@ -268,7 +364,7 @@ def build_sig_arg(arg, cons, var_dict):
 
     """
     from hask3.lang.hindley_milner import TypeVariable, TypeOperator
-    from hask3.lang.hindley_milner import Tuple, ListType
+    from hask3.lang.hindley_milner import Tuple, ListType, ground
     if isinstance(arg, str):
         if arg.islower():
             if arg not in var_dict:
@@ -290,7 +386,7 @@ def build_sig_arg(arg, cons, var_dict):
         res = TypeOperator(hkt, types)
     # None (the unit type)
     elif arg is None:
-        res = TypeOperator(None, [])
+        res = ground(None)
     # Tuples: ("a", "b"), (int, ("a", float)), etc.
     elif isinstance(arg, tuple):
         f = lambda x: build_sig_arg(x, cons, var_dict)
@@ -303,7 +399,7 @@ def build_sig_arg(arg, cons, var_dict):
             res = None
     # any other type, builtin or user-defined
     elif isinstance(arg, type):
-        res = TypeOperator(arg, [])
+        res = ground(arg)
     else:
         res = None
     if res is not None:
@@ -350,33 +446,346 @@ def build_sig(type_signature, var_dict=None):
     return [build_sig_arg(i, cons, var_dict) for i in args]
 
 
+def build_checkers(fn_type, count):
+    """Compile a function type into a predicate for each of its positions.
+
+    A position gets a predicate only when its type can be checked without
+    unification: ground types whose internal representation is determined by
+    the Python class of the value (builtins, user classes, `None`,
+    `PyFunc`:class: and tuples of them), `ADTs <ADT>`:class: and lists
+    whose type parameters are free, and unconstrained type variables.  In
+    all the cases the type variables involved must not appear in any other
+    position of the signature.
+
+    :param fn_type: the function type (see `make_fn_type`:func:).
+
+    :param count: the number of positions -the arguments plus the result- in
+           `fn_type`.
+
+    :returns: A tuple with a predicate, or None if unification is required,
+              for each position.
+
+    """
+    from collections import Counter
+    from hask3.hack import is_python_function
+    from hask3.lang.hindley_milner import TypeVariable, prune
+    positions = []
+    t = fn_type
+    for _ in range(count - 1):
+        t = prune(t)
+        positions.append(t.types[0])
+        t = t.types[1]
+    positions.append(t)
+    occurrences = Counter()
+    pending = list(positions)
+    while pending:
+        t = prune(pending.pop())
+        if isinstance(t, TypeVariable):
+            occurrences[t] += 1
+        else:
+            if isinstance(t.name, TypeVariable):
+                occurrences[t.name] += 1
+            pending.extend(t.types)
+
+    def free(t):
+        t = prune(t)
+        return (isinstance(t, TypeVariable) and not t.constraints and
+                occurrences[t] == 1)
+
+    def checker(t):
+        t = prune(t)
+        if isinstance(t, TypeVariable):
+            return _anything if free(t) else None
+        name, types = t.name, t.types
+        if name == '[]':
+            ok = free(types[0])
+            return _is_list if ok else None
+        elif name is tuple:
+            items = [checker(i) for i in types]
+            if None not in items:
+                size = len(items)
+                return lambda x: (type(x) is tuple and len(x) == size and
+                                  all(f(i) for f, i in zip(items, x)))
+            else:
+                return None
+        elif isinstance(name, type) and issubclass(name, ADT):
+            if all(free(i) for i in types):
+                return lambda x: isinstance(x, name)
+            else:
+                return None
+        elif types:
+            return None
+        elif name is None:
+            return lambda x: x is None
+        elif name is PyFunc:
+            return is_python_function
+        elif isinstance(name, type) and not issubclass(name, Hask):
+            return lambda x: type(x) is name
+        else:
+            return None
+
+    return tuple(checker(t) for t in positions)
+
+
+def _is_list(obj):
+    from hask3.lang.lazylist import List
+    return isinstance(obj, List)
+
+
+def _anything(obj):
+    """Predicate for free type variables; only `Undefined` is rejected."""
+    return not isinstance(obj, Undefined)
+
+
+def _type_shape(obj):
+    """Return a hashable key that determines the type of `obj`.
+
+    Only objects whose type in the internal type system is fully determined
+    by their Python class -plus the class of their elements for tuples and
+    Lists- have a shape.  Return None for any other object.
+
+    """
+    from hask3.hack import is_python_function
+    if isinstance(obj, Hask):
+        from hask3.lang.lazylist import List
+        if type(obj) is List:
+            from hask3.lang.hindley_milner import prune, TypeOperator
+            item = prune(typeof(obj).types[0])
+            if isinstance(item, TypeOperator) and not item.types:
+                return (List, item.name)
+        return None
+    elif isinstance(obj, tuple):
+        res = tuple(_type_shape(o) for o in obj)
+        return None if None in res else (tuple, res)
+    elif is_python_function(obj):
+        return PyFunc
+    else:
+        return type(obj)
+
+
+#: Statistics of the call-site cache of a `TypedFunc`:class:.  See
+#: `TypedFunc.cache_info`:meth:.
+CacheInfo = namedtuple('CacheInfo', 'hits misses currsize')
+
+
+#: Name of the environment variable with the initial type-checking mode.
+#: Its value is ``full``, ``off``, or ``sampled`` optionally followed by the
+#: rate as in ``sampled:100``.
+TYPECHECK_ENVVAR = 'HASK3_TYPECHECK'
+
+TYPECHECK_MODES = ('full', 'sampled', 'off')
+
+
+def _typecheck_policy(mode, sample_rate=None):
+    """Validate a type-checking mode and return it as a `(mode, rate)` pair."""
+    if mode not in TYPECHECK_MODES:
+        modes = ', '.join(TYPECHECK_MODES)
+        raise ValueError(f"Type-checking mode must be one of {modes}; "
+                         f"found {mode!r}")
+    if sample_rate is None:
+        sample_rate = typecheck.default_sample_rate
+    elif not isinstance(sample_rate, int) or sample_rate < 1:
+        msg = f"Sample rate must be a positive integer; found {sample_rate!r}"
+        raise ValueError(msg)
+    return (mode, sample_rate if mode == 'sampled' else 1)
+
+
+def _parse_typecheck(spec):
+    """Parse the value of the `TYPECHECK_ENVVAR`:obj: environment variable."""
+    mode, _, rate = spec.strip().lower().partition(':')
+    try:
+        return _typecheck_policy(mode, int(rate) if rate else None)
+    except ValueError as error:
+        raise ValueError(f"Invalid {TYPECHECK_ENVVAR}={spec!r}") from error
+
+
+class typecheck:
+    """Context manager to set the type-checking mode of typed functions.
+
+    Every call to a `TypedFunc`:class: is type-checked with one of these
+    modes:
+
+    - ``'full'`` (the default) checks every call.
+
+    - ``'sampled'`` checks one every `sample_rate` calls to each function.
+
+    - ``'off'`` calls the wrapped Python function without any checks, only
+      currying is kept.
+
+    The initial mode is taken from the `TYPECHECK_ENVVAR`:obj: environment
+    variable.  The mode set with this context manager is local to the
+    current context, like the `~hask3.lang.syntax.MatchStack`:class:, so it
+    applies to the current thread or asyncio task only.  A mode given to
+    `~hask3.lang.syntax.sig`:class: takes precedence over it::
+
+        with typecheck('sampled', sample_rate=1000):
+            result = foldr(add, 0, L[1, ...,  10000])
+
+    """
+
+    default_sample_rate = 100
+
+    def __init__(self, mode, sample_rate=None):
+        self.policy = _typecheck_policy(mode, sample_rate)
+
+    @classmethod
+    def current(cls):
+        """Return the active `(mode, sample_rate)` pair."""
+        return cls.__policies__.get()[0]
+
+    def __enter__(self):
+        # the active policy is the head of a linked list, so the previous one
+        # is restored in the same context even if contexts overlap
+        policies = typecheck.__policies__
+        policies.set((self.policy, policies.get()))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        policies = typecheck.__policies__
+        policies.set(policies.get()[1])
+
+
+def _init_typecheck():
+    import os
+    from hask3.hack import context_local
+    policy = _parse_typecheck(os.environ.get(TYPECHECK_ENVVAR, 'full'))
+    typecheck.__policies__ = context_local('hask3.typecheck', (policy, ()))
+
+
+_init_typecheck()
+
+
 # TODO: Implement string representation.
 class TypedFunc(Hask):
-    """Partially applied, statically typed function wrapper."""
-    def __init__(self, fn, fn_args, fn_type):
+    """Partially applied, statically typed function wrapper.
+
+    Each instance keeps a (monomorphic) call-site cache: the type inferred
+    for a call is reused for later calls whose arguments have the same "type
+    shape" (see `cache_info`:meth:).
+
+    Calls are type-checked according to `typecheck`; the active mode of the
+    `typecheck`:class: context manager is used when it's None.  Partial
+    applications share the `typecheck` mode and the sampling counter of the
+    original function.
+
+    """
+
+    #: Maximum number of type shapes cached per function.  When the cache is
+    #: full, the shape least recently used is discarded.
+    cache_size = 128
+
+    def __init__(self, fn, fn_args, fn_type, typecheck=None, calls=None,
+                 checkers=None):
+        from collections import OrderedDict
+        from itertools import count
         self.__doc__ = fn.__doc__
         self.func = fn
         self.fn_args = fn_args
         self.fn_type = fn_type
+        self.typecheck = typecheck
+        if checkers is None:
+            checkers = build_checkers(fn_type, len(fn_args))
+        self.checkers = checkers
+        self.__fast = next((i for i, c in enumerate(checkers[:-1])
+                            if c is None), len(checkers) - 1)
+        self.__calls = count() if calls is None else calls
+        self.__cache = OrderedDict()
+        self.__hits = self.__misses = 0
 
     def __type__(self):
         return self.fn_type
 
-    def __call__(self, *args, **kwargs):
+    def cache_info(self):
+        """Report the statistics of the call-site cache.
+
+        :returns: a `CacheInfo`:obj: named tuple with the number of `hits`,
+                  `misses` and the current size of the cache.
+
+        """
+        return CacheInfo(self.__hits, self.__misses, len(self.__cache))
+
+    def cache_clear(self):
+        """Clear the call-site cache and its statistics."""
+        self.__cache.clear()
+        self.__hits = self.__misses = 0
+
+    def __infer(self, args):
+        """Infer the type of the application of `args` to this function."""
+        from hask3.lang.hindley_milner import Var, App
         # the environment contains the type of the function and the types
         # of the arguments
-        from functools import partial
-        from hask3.lang.hindley_milner import Var, App
-        from hask3.lang.hindley_milner import unify
         # Using 'id' is an issue could produce errors.
         env = {id(self): self.fn_type}
         env.update({id(arg): typeof(arg) for arg in args})
         ap = Var(id(self))
         for arg in args:
-            if isinstance(arg, Undefined):
-                return arg
             ap = App(ap, Var(id(arg)))
-        result_type = ap.analyze(env)
+        return ap.analyze(env)
+
+    def __skip_check(self):
+        """Tell if the current call must not be type-checked."""
+        mode, rate = self.typecheck or typecheck.current()
+        if mode == 'full':
+            return False
+        elif mode == 'off':
+            return True
+        else:
+            return next(self.__calls) % rate != 0
+
+    def __call__(self, *args, **kwargs):
+        from functools import partial
+        from hask3.lang.hindley_milner import unify, fresh, isGround
+        count = len(args)
+        arity = len(self.fn_args) - 1
+        if self.__skip_check():
+            checked = False
+        elif count <= self.__fast and (count < arity or self.checkers[-1]):
+            # signature positions checked without unification
+            checked = all(check(arg) for check, arg in zip(self.checkers,
+                                                           args))
+            if not checked:
+                checked = None    # report errors with unification
+        else:
+            checked = None
+        if checked is not None:
+            # undefined arguments come from the bodies of pattern matching
+            # lines that don't match, don't evaluate them
+            for arg in args:
+                if isinstance(arg, Undefined):
+                    return arg
+            if count >= arity:
+                result = self.func(*args, **kwargs)
+                check = self.checkers[-1]
+                if checked and not (check is None or check(result)):
+                    unify(fresh(self.fn_args[-1]), typeof(result))
+                return result
+            else:
+                fn_args = self.fn_args[count:]
+                return TypedFunc(partial(self.func, *args, **kwargs),
+                                 fn_args, make_fn_type(fn_args),
+                                 self.typecheck, self.__calls,
+                                 self.checkers[count:])
+        key = tuple(map(_type_shape, args))
+        cached = self.__cache.get(key) if None not in key else None
+        if cached is not None:
+            self.__hits += 1
+            self.__cache.move_to_end(key)
+            result_type, ground = cached
+            if not ground:
+                result_type = fresh(result_type)
+        else:
+            self.__misses += 1
+            undefined = next((a for a in args if isinstance(a, Undefined)),
+                             None)
+            if undefined is not None:
+                return undefined
+            result_type = self.__infer(args)
+            if None not in key:
+                ground = isGround(result_type)
+                snapshot = result_type if ground else fresh(result_type)
+                self.__cache[key] = (snapshot, ground)
+                if len(self.__cache) > self.cache_size:
+                    self.__cache.popitem(last=False)
 
         if len(self.fn_args) - 1 == len(args):
             result = self.func(*args)
@@ -384,7 +793,9 @@ class TypedFunc(Hask):
             return result
         else:
             return TypedFunc(partial(self.func, *args, **kwargs),
-                             self.fn_args[len(args):], result_type)
+                             self.fn_args[len(args):], result_type,
+                             self.typecheck, self.__calls,
+                             self.checkers[len(args):])
 
     def __mod__(self, arg):
         """(%) :: (a -> b) -> a -> b
@@ -561,6 +972,37 @@ class PatternMatchListBind:
         self.tail = tail
 
 
+class CompiledPattern:
+    """A pattern compiled once into a matcher.
+
+    See `compile_pattern`:func:.  It may be used wherever a pattern is
+    expected, alone or nested in another pattern, and is not built again
+    each time it is matched.
+
+    :param pattern: a pattern, as accepted by `pattern_match`:func:.
+
+    """
+    def __init__(self, pattern):
+        names = []
+        self.pattern = pattern
+        self.matcher = compile_pattern(pattern, names)
+        #: The names of the variables bound, in the order of their values.
+        self.names = tuple(names)
+
+    def match(self, value):
+        """Match `value`.
+
+        :returns: a dictionary with the variables bound, or None if the
+                  value doesn't match.
+
+        """
+        binds = []
+        if self.matcher(value, binds):
+            return dict(zip(self.names, binds))
+        else:
+            return None
+
+
 # TODO: This must return an Either monad ;)
 def pattern_match(value, pattern, env=None):
     """Pattern match a value and a pattern.
@@ -579,7 +1021,6 @@ def pattern_match(value, pattern, env=None):
         pattern
 
     """
-    from hask3.hack import is_collection, nt_to_tuple
     env = {} if env is None else env
     if isinstance(pattern, PatternMatchBind):
         if pattern.name in env:
@@ -587,16 +1028,41 @@ def pattern_match(value, pattern, env=None):
         else:
             env[pattern.name] = value
             return True, env
+    elif isinstance(pattern, CompiledPattern):
+        binds = []
+        if pattern.matcher(value, binds):
+            for name, bound in zip(pattern.names, binds):
+                if name in env:
+                    raise SyntaxError(f"Conflicting definitions for {name}")
+                env[name] = bound
+            return True, env
+        else:
+            return False, env
     elif isinstance(pattern, PatternMatchListBind):
-        head, tail = list(value[:len(pattern.head)]), value[len(pattern.head):]
+        from hask3.lang.lazylist import List
+        count = len(pattern.head)
+        if isinstance(value, List):
+            # a view of the tail, the elements are not copied
+            split = value.uncons(count)
+            if split is None:
+                return False, env
+            head, tail = split
+        else:
+            head, tail = list(value[:count]), value[count:]
         matches, env = pattern_match(head, pattern.head, env)
         if matches:
             return pattern_match(tail, pattern.tail, env)
         else:
             return False, env
     elif type(value) == type(pattern):
+        from hask3.hack import is_collection
         if isinstance(value, ADT):
-            return pattern_match(nt_to_tuple(value), nt_to_tuple(pattern), env)
+            # Same data constructor: match the fields by position.
+            for v, p in zip(tuple.__iter__(value), tuple.__iter__(pattern)):
+                match_status, env = pattern_match(v, p, env)
+                if not match_status:
+                    return False, env
+            return True, env
         elif is_collection(value):
             if len(value) != len(pattern):
                 return False, env
@@ -612,3 +1078,235 @@ def pattern_match(value, pattern, env=None):
             return False, env
     else:
         return False, env
+
+
+def compile_pattern(pattern, names):
+    """Compile a pattern into a matcher function.
+
+    The matcher has the signature ``matcher(value, binds)``; it returns True
+    if `value` matches `pattern`, appending to the list `binds` the values of
+    the variables bound by the pattern (from left to right.)  The wildcard
+    ``_`` matches any value without binding it.
+
+    :param pattern: a pattern, as accepted by `pattern_match`:func:.
+
+    :param names: a list where the names of the bound variables are appended
+           in the same order that their values are bound.
+
+    :raises SyntaxError: if a variable name is used multiple times in the same
+        pattern
+
+    """
+    from hask3.hack import is_collection
+    from hask3.lang.lazylist import List
+    if isinstance(pattern, CompiledPattern):
+        for name in pattern.names:
+            if name in names:
+                raise SyntaxError(f"Conflicting definitions for {name}")
+        names.extend(pattern.names)
+        return pattern.matcher
+    elif isinstance(pattern, PatternMatchBind):
+        name = pattern.name
+        if name == '_':
+            return _match_any
+        elif name in names:
+            raise SyntaxError(f"Conflicting definitions for {name}")
+        else:
+            names.append(name)
+            return _match_bind
+    elif isinstance(pattern, PatternMatchListBind):
+        heads = [compile_pattern(item, names) for item in pattern.head]
+        tail = compile_pattern(pattern.tail, names)
+        count = len(heads)
+
+        def match(value, binds):
+            if isinstance(value, List):
+                split = value.uncons(count)
+                if split is None:
+                    return False
+                head, rest = split
+            else:
+                head = value[:count]
+                if len(head) != count:
+                    return False
+                rest = value[count:]
+            for matcher, item in zip(heads, head):
+                if not matcher(item, binds):
+                    return False
+            return tail(rest, binds)
+    elif isinstance(pattern, ADT):
+        cls = type(pattern)
+        fields = tuple(enumerate(compile_pattern(item, names)
+                                 for item in tuple.__iter__(pattern)))
+        positions = _bound_fields(pattern)
+        field = tuple.__getitem__
+        if positions is not None:
+            # Only binds: unpack the fields by position.
+            def match(value, binds):
+                if type(value) is cls:
+                    binds.extend(field(value, i) for i in positions)
+                    return True
+                else:
+                    return False
+        else:
+            def match(value, binds):
+                if type(value) is cls:
+                    for i, matcher in fields:
+                        if not matcher(field(value, i), binds):
+                            return False
+                    return True
+                else:
+                    return False
+    elif is_collection(pattern):
+        cls = type(pattern)
+        items = [compile_pattern(item, names) for item in pattern]
+        count = len(items)
+        if cls is List:
+            # don't evaluate more than needed to know the length
+            size = lambda value: len(value[:count + 1])
+        else:
+            size = len
+
+        def match(value, binds):
+            if type(value) is cls and size(value) == count:
+                for matcher, item in zip(items, value):
+                    if not matcher(item, binds):
+                        return False
+                return True
+            else:
+                return False
+    else:
+        cls = type(pattern)
+
+        def match(value, binds):
+            return type(value) is cls and value == pattern
+    return match
+
+
+def _bound_fields(pattern):
+    """Return the positions of the fields an ADT `pattern` binds.
+
+    None if some field is not a bind, i.e. the pattern may fail to match a
+    value of its data constructor.
+
+    """
+    res = []
+    for i, item in enumerate(tuple.__iter__(pattern)):
+        if not isinstance(item, PatternMatchBind):
+            return None
+        elif item.name != '_':
+            res.append(i)
+    return tuple(res)
+
+
+def _match_any(value, binds):
+    return True
+
+
+def _match_bind(value, binds):
+    binds.append(value)
+    return True
+
+
+class PatternTable:
+    """A decision table for a sequence of patterns.
+
+    Patterns are compiled once (see `compile_pattern`:func:).  Each class of
+    matched values gets its own list of candidate patterns: those that can
+    match values of that class, so other constructors and literals are never
+    tested.  Consecutive literal patterns are tested with a single dictionary
+    lookup.
+
+    The lists for the data constructors of the ADTs in the patterns are built
+    upfront, indexed by ``__ADT_slot__``.  A data constructor pattern whose
+    fields are all binds takes the fields by position without further tests.
+
+    :param patterns: the sequence of patterns.
+
+    """
+    def __init__(self, patterns):
+        from hask3.hack import is_collection
+        self.names = []
+        self.__lines = []
+        adts = []
+        for pattern in patterns:
+            names = []
+            matcher = compile_pattern(pattern, names)
+            self.names.append(tuple(names))
+            while isinstance(pattern, CompiledPattern):
+                pattern = pattern.pattern
+            if isinstance(pattern, (PatternMatchBind, PatternMatchListBind)):
+                key, literal = None, False
+            else:
+                key = type(pattern)
+                literal = not (isinstance(pattern, ADT) or
+                               is_collection(pattern))
+                if literal:
+                    try:
+                        hash(pattern)
+                    except TypeError:
+                        literal = False
+                elif isinstance(pattern, ADT):
+                    positions = _bound_fields(pattern)
+                    if positions == tuple(range(len(pattern._fields))):
+                        matcher = None    # all the fields
+                    elif positions is not None:
+                        matcher = positions
+                    if key.__type_constructor__ not in adts:
+                        adts.append(key.__type_constructor__)
+            self.__lines.append((key, matcher, literal, pattern))
+        self.__dispatch = {}
+        for adt in adts:
+            for cls in self.__slots(adt):
+                self.__dispatch[cls] = self.__candidates(cls)
+
+    @staticmethod
+    def __slots(adt):
+        """Return the classes of the data constructors of `adt` by slot."""
+        res = [dcon if isinstance(dcon, type) else type(dcon)
+               for dcon in adt.__constructors__]
+        res.sort(key=lambda cls: cls.__ADT_slot__)
+        return res
+
+    def __candidates(self, cls):
+        """Build the list of tests for values of class `cls`."""
+        res = []
+        for index, (key, matcher, literal, pattern) in enumerate(self.__lines):
+            if key is None or key is cls:
+                if literal:
+                    if not (res and type(res[-1]) is dict):
+                        res.append({})
+                    res[-1].setdefault(pattern, index)
+                else:
+                    res.append((index, matcher))
+        return res
+
+    def match(self, value):
+        """Find the first pattern that matches `value`.
+
+        :returns: a pair with the index of the pattern and the list of the
+                  values bound (in the order of `names`), or None if no
+                  pattern matches.
+
+        """
+        cls = type(value)
+        tests = self.__dispatch.get(cls)
+        if tests is None:
+            tests = self.__dispatch.setdefault(cls, self.__candidates(cls))
+        for test in tests:
+            if type(test) is dict:
+                index = test.get(value)
+                if index is not None:
+                    return index, []
+            else:
+                index, matcher = test
+                if matcher is None:
+                    return index, [*tuple.__iter__(value)]
+                elif type(matcher) is tuple:
+                    # the positions of the fields bound
+                    return index, [tuple.__getitem__(value, i)
+                                   for i in matcher]
+                binds = []
+                if matcher(value, binds):
+                    return index, binds
+        return None
@@ -403,6 +403,38 @@ class TestBuiltins(unittest.TestCase):
         self.assertTrue(has_instance(float, Num))
         self.assertTrue(has_instance(complex, Num))
 
+    def test_instance_dispatch(self):
+        from hask3.Prelude import show
+
+        class Point:
+            def __init__(self, x, y):
+                self.x, self.y = x, y
+
+        with self.assertRaises(TypeError):
+            Show[Point(1, 2)]
+        with self.assertRaises(TypeError):
+            Show[Point(1, 2)]
+        self.assertIn(Point, Show.__dispatch__)
+
+        instance(Show, Point).where(show=lambda p: f"Point({p.x}, {p.y})")
+        self.assertEqual("Point(1, 2)", show(Point(1, 2)))
+        self.assertIs(Show[Point(3, 4)], Show[Point(5, 6)])
+        self.assertIs(Show[Just(1)], Show[Nothing])
+        self.assertEqual("L[1, 2]", show(L[1, 2]))
+
+    def test_instance_records(self):
+        from hask3.lang.type_system import InstanceRecord
+        from hask3.Data.Foldable import length
+
+        self.assertIsInstance(Num[1], InstanceRecord)
+        self.assertIs(type(Num[1]), type(Num[1.0]))
+        self.assertFalse(hasattr(Num[1], "__dict__"))
+        self.assertIs(Num[1].negate, Num.method("negate", 2))
+        self.assertIs(Functor[Just(1)].fmap, Functor.method("fmap", Nothing))
+        self.assertEqual(3, length(L[1, 2, 3]))
+        with self.assertRaises(TypeError):
+            Num.method("negate", "a")
+
 
 class Test_README_Examples(unittest.TestCase):
     """Make sure the README examples are all working"""
@@ -419,3 +419,69 @@ class TestHindleyMilner(unittest.TestCase):
             typeof(Left(2.0)),
             TypeOperator(Either,
                          [TypeOperator(float, []), TypeVariable()]))
+
+    def test_union_find(self):
+        """Unified type variables share a single representative"""
+        from hask3.lang.hindley_milner import prune
+
+        # a long chain of variables: no recursion limit and a single root
+        chain = [TypeVariable() for _ in range(5000)]
+        for left, right in zip(chain, chain[1:]):
+            self.unified(left, right)
+        root = prune(chain[0])
+        self.assertTrue(all(prune(v) is root for v in chain))
+        self.assertTrue(all(v.parent in (None, root) for v in chain))
+
+        # binding any member of the set binds all of them
+        self.unified(chain[-1], self.Integer)
+        self.assertTrue(all(prune(v) is self.Integer for v in chain))
+        with self.assertRaises(TypeError):
+            unify(chain[1234], self.Bool)
+
+        # occurs check still works through the representative
+        a, b = TypeVariable(), TypeVariable()
+        self.unified(a, b)
+        with self.assertRaises(TypeError):
+            unify(a, Function(b, self.Integer))
+
+    def test_levels(self):
+        """Generic variables are told apart by their binding level"""
+        from hask3.lang.hindley_milner import GENERIC, prune
+
+        # let polymorphism inside a lambda: `x` is non-generic, `f` is generic
+        # \x -> let f = (\y -> y) in ((f x), (f True)) :: a -> (a, Bool)
+        a = TypeVariable()
+        self.typecheck(
+            Lam("x", Let("f", Lam("y", Var("y")),
+                         App(App(Var("pair"), App(Var("f"), Var("x"))),
+                             App(Var("f"), Var("True"))))),
+            Function(a, TypeOperator("*", [a, self.Bool])))
+
+        # the type inferred for a lambda is fully generic once analyzed, so it
+        # can be reused inside another lambda at the same depth.
+        idtype = Lam("n", Var("n")).analyze(self.env)
+        self.assertEqual(GENERIC, prune(idtype.types[0]).level)
+        env = dict(self.env, myid=idtype)
+        expr = Lam("z", App(App(Var("pair"), App(Var("myid"), Var("4"))),
+                            App(Var("myid"), Var("True"))))
+        self.assertIsNotNone(expr.analyze(env))
+
+    def test_ground_types(self):
+        """Ground types are interned and compared structurally"""
+        from hask3.lang.hindley_milner import ground, ListType
+
+        self.assertIs(ground(int), ground(int))
+        self.assertIs(ground(int), typeof(1))
+        self.assertIs(ground(None), typeof(None))
+        self.assertIs(typeof(1.0), build_sig_arg(float, {}, {}))
+        self.assertEqual(TypeOperator(int, []), ground(int))
+        self.assertNotEqual(ground(int), ground(float))
+        self.assertEqual(ListType(ground(str)), ListType(ground(str)))
+        self.assertEqual(hash(Tuple([ground(int), ground(str)])),
+                         hash(Tuple([ground(int), ground(str)])))
+        self.assertEqual(Tuple([ground(int)]), typeof((1, )))
+
+        a = TypeVariable()
+        self.assertEqual(ListType(a), ListType(a))
+        self.assertNotEqual(ListType(a), ListType(TypeVariable()))
+        self.unified(ground(int), typeof(2))
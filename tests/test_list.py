@@ -323,3 +323,370 @@ class TestList(unittest.TestCase):
         self.assertEqual(1, len(L[None, ]))
         self.assertEqual(3, len(L[1, 2, 3]))
         self.assertEqual(20, len(L[0, ..., 19]))
+
+    def test_lazy_type_check(self):
+        produced = []
+
+        def items(*args):
+            for x in args:
+                produced.append(x)
+                yield x
+
+        @sig(H/ ["a"] >> ["a"])
+        def ident(xs):
+            return L[(x for x in xs)]
+
+        @sig(H/ [int] >> [int])
+        def ints(xs):
+            return L[(x for x in xs)]
+
+        result = ident(ident(ints(ident(L[items(1, 2, "c")]))))
+        self.assertEqual([], produced)
+        self.assertEqual(2, result[1])
+        self.assertEqual([1, 2], produced)
+        with self.assertRaises(TypeError):
+            result[2]
+
+    def test_homogeneous(self):
+        self.assertEqual(1000, len(L[range(1000)]))
+        self.assertEqual(3, len(L[(x for x in (None, None, None))]))
+        with self.assertRaises(TypeError):
+            L[1, 2, True]
+        with self.assertRaises(TypeError):
+            L[(1, "a"), (1, 2)]
+        with self.assertRaises(TypeError):
+            len(L[(x for x in (1, 2, 3.0))])
+        with self.assertRaises(TypeError):
+            len(L[1, 2] + L[(x for x in (3, "4"))])
+
+    def test_uncons(self):
+        from hask3 import caseof, m, p, lazy
+        evaluated = []
+
+        def gen():
+            for x in range(5):
+                evaluated.append(x)
+                yield x
+
+        xs = L[gen()]
+        head, rest = xs.uncons(2)
+        self.assertEqual([0, 1], head)
+        self.assertEqual([0, 1], evaluated)
+        self.assertEqual(2, rest[0])
+        self.assertEqual(2, xs[2])
+        self.assertEqual([0, 1, 2], evaluated)
+        self.assertEqual(L[2, 3, 4], rest)
+        self.assertEqual(3, len(rest))
+        self.assertEqual(5, len(xs))
+        self.assertEqual(4, rest[-1])
+        with self.assertRaises(IndexError):
+            rest[-4]
+        self.assertIsNone(rest.uncons(4))
+        self.assertEqual(([], L[[]]), L[[]].uncons(0))
+        with self.assertRaises(TypeError):
+            "a" ^ rest
+
+        def total(xs):
+            return ~(caseof(xs)
+                        | m(m.y ^ m.ys) >> lazy(lambda: p.y + total(p.ys))
+                        | m(m.ys)       >> 0)
+
+        self.assertEqual(45, total(L[range(10)]))
+        self.assertEqual(10, total(L[1, ..., 4]))
+
+    def test_slice_views(self):
+        from itertools import count
+        from hask3.Data.List import tail, drop, splitAt
+        evaluated = []
+
+        def gen():
+            for x in count():
+                evaluated.append(x)
+                yield x
+
+        xs = L[gen()]
+        ys = xs[2:6]
+        self.assertEqual([], evaluated)
+        self.assertEqual(3, ys[1])
+        self.assertEqual([0, 1, 2, 3], evaluated)
+        self.assertEqual(4, len(ys))
+        self.assertEqual(5, ys[-1])
+        self.assertEqual(L[3, 4], ys[1:3])
+        self.assertEqual(L[[]], ys[5:])
+        self.assertEqual([0, 1, 2, 3, 4, 5], evaluated)
+        with self.assertRaises(IndexError):
+            ys[4]
+        self.assertEqual(6, xs[6])
+        self.assertEqual(L[2, 3, 4, 5], ys)
+        self.assertEqual(L[1, 2, 3], tail(L[0, 1, 2, 3]))
+        self.assertEqual(L[2, 3], drop(2, L[0, 1, 2, 3]))
+        self.assertEqual((L[0, 1], L[2, 3]), splitAt(2, L[0, 1, 2, 3]))
+        self.assertEqual(L[2, 3], L[0, 1, 2, 3][-2:])
+        self.assertEqual(L[0, 2], L[0, 1, 2, 3][::2])
+        self.assertEqual(L[1, 2, 9], L[0, 1, 2, 3][1:3] + L[9])
+        self.assertEqual(L[9, 2, 3], 9 ^ L[0, 1, 2, 3][2:])
+        self.assertEqual(ys, ys.copy())
+        self.assertEqual(L[4, 5], xs[4:].copy()[:2])
+
+    def test_empty_views(self):
+        xs = 7 ^ L[9, 6, 1]
+        for empty in (xs[1:0], xs[3:1], xs[:2][5:], (3 ^ xs)[:0]):
+            self.assertEqual(0, len(empty))
+            self.assertEqual(L[[]], empty)
+            self.assertEqual("L[[]]", str(empty))
+            self.assertEqual([], list(empty[::-1]))
+            self.assertEqual(L[5], empty + L[5])
+            with self.assertRaises(IndexError):
+                empty[0]
+        self.assertEqual(L[7, 9], xs[-4:-2])
+        self.assertEqual(L[7, 9], (3 ^ xs)[1:3])
+        self.assertEqual(L[9, 6], (3 ^ xs)[2:4])
+        self.assertEqual(9, (3 ^ xs)[1:3][1])
+
+    def test_persistent_cons(self):
+        xs = L[1, 2, 3]
+        ys = 0 ^ xs
+        zs = 5 ^ xs
+        self.assertEqual(L[1, 2, 3], xs)
+        self.assertEqual(L[0, 1, 2, 3], ys)
+        self.assertEqual(L[5, 1, 2, 3], zs)
+        self.assertEqual(L[-1, 0, 1, 2, 3], -1 ^ ys)
+        self.assertEqual(L[0, 1], ys[:2])
+        self.assertEqual(3, ys[-1])
+        self.assertEqual(0, ys[-4])
+        with self.assertRaises(TypeError):
+            "a" ^ ys
+
+        xs = L[[]]
+        for i in range(100):
+            xs = i ^ xs
+        self.assertEqual(100, len(xs))
+        self.assertEqual(99, xs[0])
+        self.assertEqual(L[97, 96], xs[2:4])
+        self.assertEqual(list(range(99, -1, -1)), list(xs))
+        self.assertEqual(L[3, 1, 2], 3 ^ L[(x for x in (1, 2))])
+
+    def test_concat_rope(self):
+        from itertools import count
+        evaluated = []
+
+        def gen():
+            for x in count(10):
+                evaluated.append(x)
+                yield x
+
+        xs = L[[]]
+        for i in range(100):
+            xs += L[i, i]
+        self.assertEqual(200, len(xs))
+        self.assertEqual(L[0, 0, 1], xs[:3])
+        self.assertEqual(99, xs[-1])
+        ys = L[1, 2] + L[gen()] + L[3]
+        self.assertEqual([10], evaluated)
+        self.assertEqual("L[1, 2 ...]", str(ys))
+        self.assertEqual(L[1, 2, 10, 11], ys[:4])
+        self.assertEqual([10, 11], evaluated)
+        self.assertEqual("L[1, 2, 3]", str(L[1] + L[2] + L[3]))
+        self.assertEqual(L[1], L[1] + L[[]])
+        self.assertEqual(L[0, 1, 2], 0 ^ (L[1] + L[2]))
+        with self.assertRaises(TypeError):
+            xs + L["a"]
+
+        # nested concatenations are spliced, not nested
+        from hask3.Data.List import tail
+        xs = L[[0]]
+        for i in range(1, 3000):
+            xs = L[[i]] + xs
+        self.assertEqual(3000, len(xs))
+        self.assertEqual(L[2999, 2998], xs[:2])
+        ys = L[[0]]
+        for i in range(1, 3000):
+            ys = tail(i ^ ys) + L[[i]]
+        self.assertEqual(3000, len(ys))
+        self.assertEqual(L[2998, 2999], ys[-2:])
+        zs = L[[0]]
+        for i in range(1, 3000):
+            zs = (L[[-i]] + zs) + (i ^ L[[i]])
+        self.assertEqual(L[-2999, -2998], zs[:2])
+        self.assertEqual(L[2999, 2999], zs[-2:])
+
+    def test_chunk_size(self):
+        from hask3.lang.lazylist import List
+        evaluated = []
+
+        def gen(n):
+            for x in range(n):
+                evaluated.append(x)
+                yield x
+
+        xs = L[gen(100)]
+        self.assertEqual(1, xs.chunk_size)
+        self.assertEqual(50, xs[50])
+        self.assertEqual(51, len(evaluated))
+        self.assertEqual(100, len(xs))
+        del evaluated[:]
+        xs = L[gen(100)]
+        ys = xs[10:]
+        ys.chunk_size = 16
+        self.assertEqual(16, xs.chunk_size)
+        self.assertEqual(0, next(iter(xs)))
+        self.assertEqual(16, len(evaluated))
+        self.assertEqual(sum(range(10, 100)), sum(ys))
+        self.assertEqual(L[range(100)], xs)
+        xs.chunk_size = None
+        self.assertEqual(List.default_chunk_size, xs.chunk_size)
+        with self.assertRaises(ValueError):
+            xs.chunk_size = 0
+        zs = L[(x for x in (1, 2, "a"))]
+        zs.chunk_size = 4
+        with self.assertRaises(TypeError):
+            len(zs)
+        self.assertEqual(1, zs[0])
+        self.assertEqual(L[1, 2], zs[:2])
+        with self.assertRaises(TypeError):
+            zs[2]
+        with self.assertRaises(TypeError):
+            list(zs)
+        xs = L[iter([1, 2, 3, "a", 5])]
+        xs.chunk_size = 8
+        with self.assertRaises(TypeError):
+            len(xs)
+        self.assertEqual(1, xs[0])
+        self.assertEqual(L[1, 2, 3], xs[:3])
+        with self.assertRaises(TypeError):
+            list(xs)
+
+    def test_stream(self):
+        from hask3 import StreamConsumedError, caseof, m, p, lazy
+        from hask3.Data.List import filter, map, length, takeWhile
+        even = sig(H/ int >> bool)(lambda x: x % 2 == 0)
+        double = sig(H/ int >> int)(lambda x: 2 * x)
+        small = sig(H/ int >> bool)(lambda x: x < 100)
+
+        xs = L.stream[(x for x in range(10))]
+        ys = map(double, filter(even, xs))
+        self.assertTrue(xs.is_stream)
+        self.assertTrue(ys.is_stream)
+        self.assertFalse(L[1, 2].is_stream)
+        self.assertEqual([0, 4, 8, 12, 16], list(ys))
+        with self.assertRaises(StreamConsumedError):
+            list(xs)
+        with self.assertRaises(StreamConsumedError):
+            xs[0]
+
+        xs = L.stream[range(1000)]
+        self.assertEqual(sum(range(100)), sum(takeWhile(small, xs)))
+        self.assertEqual(5, length(L.stream[range(5)]))
+        with self.assertRaises(TypeError):
+            len(L.stream[range(5)])
+
+        xs = L.stream[(x for x in range(10))]
+        self.assertEqual(3, xs[3])
+        self.assertEqual(5, xs[5])
+        with self.assertRaises(StreamConsumedError):
+            xs[4]
+        self.assertEqual(9, xs[-1])
+
+        def total(xs):
+            return ~(caseof(xs)
+                        | m(m.y ^ m.ys) >> lazy(lambda: p.y + total(p.ys))
+                        | m(m.ys)       >> 0)
+
+        self.assertEqual(45, total(L.stream[(x for x in range(10))]))
+        xs = L.stream[(x for x in (1, 2, "a"))]
+        with self.assertRaises(TypeError):
+            list(xs)
+
+    def test_stream_len(self):
+        from hask3.Data.List import reverse, span, inits, tails
+        from hask3.Data.List import isPrefixOf, isSuffixOf
+        small = sig(H/ int >> bool)(lambda x: x < 2)
+
+        def stream():
+            return L.stream[iter([1, 2, 3])]
+
+        self.assertEqual([3, 2, 1], list(reverse(stream())))
+        front, rest = span(small, stream())
+        self.assertEqual(([1], [2, 3]), (list(front), list(rest)))
+        self.assertEqual(4, len(inits(stream())))
+        self.assertEqual(L[2, 3], tails(stream())[1])
+        self.assertTrue(isPrefixOf(stream(), L[1, 2, 3, 4]))
+        self.assertTrue(isSuffixOf(stream(), L[0, 1, 2, 3]))
+
+    def test_arithmetic_sequences(self):
+        from hask3.Data.List import sum, elem
+        xs = L[1, ...]
+        self.assertEqual(10 ** 12 + 1, xs[10 ** 12])
+        self.assertTrue(10 ** 12 in xs)
+        self.assertFalse(0 in xs)
+        self.assertEqual(L[6, 7, 8], xs[5:8])
+        self.assertEqual(L[1, 3, 5], L[1, 3, ...][:3])
+
+        xs = L[1, ..., 10 ** 12]
+        self.assertEqual(10 ** 12, len(xs))
+        self.assertEqual(10 ** 12, xs[-1])
+        self.assertEqual((10 ** 12 + 1) * 10 ** 12 // 2, sum(xs))
+        self.assertTrue(elem(10 ** 9, xs))
+        self.assertEqual(L[10, 20, 30], xs[9:30:10])
+        self.assertEqual(15, sum(xs[1:10:3]))
+        self.assertEqual(15, xs[1:10:3].closed_sum())
+        self.assertIsNone(L[1, 2, 3].closed_sum())
+        self.assertIsNone(L[1, ...].closed_sum())
+
+        for xs, ys in ((L[10, 7, ..., 0], [10, 7, 4, 1]),
+                       (L[5, ..., 1], [5, 4, 3, 2, 1]),
+                       (L[5, ..., 5], [5]),
+                       (L[1, 0, ..., 3], []),
+                       (L["a", "c", ..., "h"], ["a", "c", "e", "g"]),
+                       (L[False, ..., True], [False, True])):
+            self.assertEqual(ys, list(xs))
+            self.assertEqual(len(ys), len(xs))
+            self.assertEqual(ys[::-1], list(xs[::-1]))
+            self.assertEqual(ys[1:], list(xs[1:]))
+            for y in ys:
+                self.assertTrue(y in xs)
+        self.assertFalse("b" in L["a", "c", ..., "h"])
+        self.assertEqual(L[0, 1, 2], 0 ^ L[1, ..., 2])
+        with self.assertRaises(IndexError):
+            L[1, ..., 3][3]
+
+    def test_virtual_lists(self):
+        from hask3.Data.List import repeat, replicate, cycle, take, sum
+        xs = cycle(L[1, 2, 3])
+        self.assertEqual(2, xs[10 ** 12])
+        self.assertEqual(L[1, 2, 3, 1, 2, 3, 1], take(7, xs))
+        self.assertEqual(L[3, 1, 2], xs[10 ** 12 + 1:10 ** 12 + 4])
+        self.assertEqual(L[2, 3, 1, 2, 3], xs[1:20:4])
+        self.assertEqual(19, sum(xs[:10]))
+        self.assertTrue(3 in xs[10 ** 12:])
+        self.assertFalse(4 in xs)
+        self.assertEqual(L[2, 3], xs[1:][:2])
+        self.assertEqual(L[0, 1, 2], (0 ^ xs)[:3])
+        self.assertEqual([1, 2, 3, 1], [x for x, _ in zip(xs, range(4))])
+
+        ys = L[(x for x in "ab")]
+        self.assertEqual(L["a", "b", "a", "b", "a"], cycle(ys)[:5])
+        self.assertEqual(L[1, ..., 5], take(5, cycle(L[1, ...])))
+        self.assertEqual(L[1, 2, 1], take(3, cycle(L.stream[[1, 2]])))
+        self.assertEqual(L[[]], cycle(L[[]]))
+
+        self.assertEqual("x", repeat("x")[10 ** 12])
+        self.assertEqual(L[1, 1, 1], repeat(1)[5:8])
+        xs = replicate(10 ** 12, 2)
+        self.assertEqual(10 ** 12, len(xs))
+        self.assertEqual(2 * 10 ** 12, sum(xs))
+        self.assertEqual(L[2, 2], xs[-2:])
+        self.assertEqual(L[[]], replicate(0, 1))
+        self.assertEqual(L[1, 1, 2], replicate(2, 1) + L[2])
+
+        from hask3.lang.lazylist import List
+        self.assertEqual(L[1, 2, 1], List.cycle((1, 2), 3))
+        self.assertEqual(L[1, 2, 1, 2], List.cycle(L[1, 2])[:4])
+
+        # a finite virtual List is shown in full, an infinite one is not
+        self.assertEqual("L[1, 1, 1, 1, 1]", str(take(5, repeat(1))))
+        self.assertEqual("L[3, 4, 5]", str(L[1, ...][2:5]))
+        self.assertEqual("L['a', 'a']", str(replicate(2, "a")))
+        self.assertEqual("L[[2]]", str(L[1, ..., 3][1:2]))
+        self.assertEqual("L[ ...]", str(repeat(1)))
+        self.assertEqual("L[ ...]", str(L[1, ...]))
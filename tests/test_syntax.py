@@ -4,7 +4,7 @@ from hask3 import __
 from hask3 import TypeSignatureError
 from hask3 import NoGuardMatchException
 from hask3 import IncompletePatternError
-from hask3 import caseof, guard, otherwise
+from hask3 import caseof, guard, otherwise, compiled, lazy, pattern
 from hask3 import H, c, m, t, sig, p
 from hask3 import Just, Nothing, Maybe, Either
 from hask3 import GT, EQ, LT, Ordering, Eq, L
@@ -372,6 +372,198 @@ class TestSyntax(unittest.TestCase):
                 | m(m.a ^ 1) >> False
                 | m(m.a)     >> True)
 
+    def test_lazy(self):
+        calls = []
+
+        def f(x):
+            calls.append(x)
+            return x
+
+        self.assertEqual(2,
+                ~(caseof(Just(2))
+                    | m(Nothing)   >> lazy(lambda: f(0))
+                    | m(Just(m.a)) >> lazy(lambda: f(p.a))
+                    | m(m._)       >> lazy(lambda: f(1))))
+        self.assertEqual([2], calls)
+        self.assertEqual(3,
+                ~(guard(3)
+                    | c(__ < 0)  >> lazy(lambda: f(-1))
+                    | otherwise  >> lazy(lambda: f(3))))
+        self.assertEqual([2, 3], calls)
+
+        # A nested caseof sees its own bindings.
+        self.assertEqual((1, 10),
+                ~(caseof(Just(10))
+                    | m(Just(m.a)) >> lazy(lambda: (~(caseof(1)
+                                                         | m(m.a) >> p.a),
+                                                    p.a))
+                    | m(Nothing)   >> 11))
+
+        def fib(x):
+            return ~(caseof(x)
+                        | m(0)   >> 1
+                        | m(1)   >> 1
+                        | m(m.n) >> lazy(lambda: fib(p.n - 2) + fib(p.n - 1)))
+
+        self.assertEqual(13, fib(6))
+
+        @compiled
+        def from_just(x):
+            return ~(caseof(x)
+                        | m(Just(m.a)) >> lazy(lambda: p.a + 1)
+                        | m(Nothing)   >> lazy(lambda: 1 // 0))
+
+        self.assertNotIn("lazy", from_just.__code__.co_names)
+        self.assertEqual(3, from_just(Just(2)))
+        with self.assertRaises(ValueError):
+            lazy(1)
+
+    def test_match_stack_context(self):
+        import asyncio
+        from threading import Barrier, Thread
+        barrier = Barrier(4)
+        results = {}
+
+        def run(x):
+            results[x] = ~(caseof(x)
+                            | m(m.a) >> [barrier.wait(), p.a][1])
+
+        threads = [Thread(target=run, args=(x, )) for x in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual({x: x for x in range(4)}, results)
+
+        async def task(x):
+            return ~(caseof(x)
+                        | m(m.a) >> [await asyncio.sleep(0), p.a][1])
+
+        async def main():
+            return await asyncio.gather(*(task(x) for x in range(4)))
+
+        self.assertEqual([0, 1, 2, 3], asyncio.run(main()))
+
+    def test_match_stack_frames(self):
+        from hask3.lang.syntax import MatchStack
+        self.assertEqual(0, MatchStack.depth())
+        for i in range(3):
+            with self.assertRaises(ZeroDivisionError):
+                ~(caseof(i) | m(m.a) >> p.a // 0)
+        self.assertEqual(0, MatchStack.depth())
+
+        def inner():
+            try:
+                return ~(caseof(1) | m(m.a) >> p.a // 0)
+            except ZeroDivisionError:
+                return MatchStack.depth()
+
+        self.assertEqual((1, 5),
+                ~(caseof(5)
+                    | m(m.a) >> (inner(), p.a)))
+        self.assertEqual(0, MatchStack.depth())
+
+    def test_pattern(self):
+        from hask3 import cases
+        just = pattern(Just(m.a))
+        pair = pattern((m.a, m.b))
+        self.assertEqual(("a", ), just.names)
+        self.assertEqual({"a": 1}, just.match(Just(1)))
+        self.assertIsNone(just.match(Nothing))
+        self.assertEqual(2,
+                ~(caseof(Just(2))
+                    | m(Nothing) >> 0
+                    | m(just)    >> p.a))
+        self.assertEqual((2, 1),
+                ~(caseof((1, 2))
+                    | m(pair) >> (p.b, p.a)))
+        self.assertEqual((1, 2),
+                ~(caseof((Just(1), 2))
+                    | m((just, m.b)) >> (p.a, p.b)))
+        with self.assertRaises(SyntaxError):
+            ~(caseof((Just(1), 2))
+                | m((just, m.a)) >> p.a)
+        with self.assertRaises(SyntaxError):
+            pattern((m.a, m.a))
+
+        from_just = cases((just, lambda a: a), (m._, lambda: None))
+        self.assertEqual(3, from_just(Just(3)))
+        self.assertIsNone(from_just(Nothing))
+
+    def test_compiled(self):
+        @compiled
+        def describe(x):
+            return ~(caseof(x)
+                        | m(Nothing)        >> "nothing"
+                        | m(Just(1))        >> "one"
+                        | m(Just((m.a, 2))) >> p.a
+                        | m(Just(m.a))      >> p.a + 1)
+
+        @compiled
+        def sign(x):
+            res = ~(guard(x)
+                        | c(__ > 0)          >> 1
+                        | c(lambda v: v < 0) >> -1
+                        | otherwise          >> 0)
+            return res
+
+        @compiled
+        def strict(x):
+            return ~(caseof(x)
+                        | m(1)       >> 1 // 0
+                        | m((m.a, )) >> p.a)
+
+        @compiled
+        def head(xs):
+            return ~(caseof(xs)
+                        | m(m.a ^ m.b) >> p.a
+                        | m(m.a)       >> None)
+
+        for fn in (describe, sign, strict):
+            self.assertNotIn("MatchStack", fn.__code__.co_names)
+            self.assertEqual(fn.__name__, fn.__code__.co_name)
+        self.assertEqual("nothing", describe(Nothing))
+        self.assertEqual("one", describe(Just(1)))
+        self.assertEqual(2, describe(Just(True)))
+        self.assertEqual(3, describe(Just(2)))
+        self.assertEqual("x", describe(Just(("x", 2))))
+        self.assertEqual(1, sign(5))
+        self.assertEqual(-1, sign(-5))
+        self.assertEqual(0, sign(0))
+        self.assertEqual("a", strict(("a", )))
+        with self.assertRaises(IncompletePatternError):
+            strict(1.0)
+        with self.assertRaises(ZeroDivisionError):
+            strict(1)
+
+        # List patterns keep the runtime path.
+        self.assertEqual(1, head(L[1, ...]))
+
+        @compiled
+        def guarded(x):
+            return ~(guard(x) | c(__ > 0) >> 1)
+
+        with self.assertRaises(NoGuardMatchException):
+            guarded(0)
+
+        # Closures are returned unchanged.
+        def closure(x):
+            return ~(caseof(x) | m(m.a) >> p.a + fn)
+
+        self.assertIs(closure, compiled(closure))
+
+        # Private names in methods are mangled with the name of the class.
+        class Counter:
+            def __init__(self, k):
+                self.__k = k
+
+            @compiled
+            def step(self, x):
+                return ~(caseof(x) | m(m.a) >> p.a + self.__k)
+
+        self.assertNotIn("caseof", Counter.step.__code__.co_names)
+        self.assertEqual(3, Counter(2).step(1))
+
     def test_type_sig(self):
         tse = TypeSignatureError
         x = lambda x: x
@@ -142,6 +142,148 @@ class TestTypeSystem(unittest.TestCase):
 
         self.assertEqual(1, eq_id(1))
 
+    def test_TypedFunc_cache(self):
+        @sig(H/ "a" >> "b" >> "a")
+        def const(x, y):
+            return x
+
+        self.assertEqual(1, const(1, "a"))
+        self.assertEqual(2, const(2, "b"))
+        self.assertEqual("x", const("x", 1))
+        self.assertEqual((1, 2), const((1, 2), L[1, 2]))
+        self.assertEqual((3, 4), const((3, 4), L[3, 4]))
+        self.assertEqual((2, 3), const.cache_info()[:2])
+        self.assertEqual(3, const.cache_info().currsize)
+        const.cache_clear()
+        self.assertEqual((0, 0, 0), tuple(const.cache_info()))
+
+        # the shape least recently used is discarded
+        const.cache_size = 2
+        for x in (1, "a", 2, 1.0, 3, "b"):
+            self.assertEqual(x, const(x, None))
+        self.assertEqual((2, 4, 2), tuple(const.cache_info()))
+
+        @sig(H/ int >> int)
+        def bad(x):
+            return x if x else "zero"
+
+        self.assertEqual(1, bad(1))
+        with self.assertRaises(TypeError):
+            bad(0)
+        with self.assertRaises(TypeError):
+            bad("a")
+
+    def test_TypedFunc_error_names(self):
+        @sig(H/ (H/ "a" >> "a") >> int)
+        def apply(f):
+            return 1
+
+        for _ in range(40):
+            with self.assertRaises(TypeError) as error:
+                apply(1)
+            self.assertEqual("Type 'int' mismatch with '(-> a a)'",
+                             str(error.exception))
+
+    def test_TypedFunc_checkers(self):
+        from hask3 import Maybe, t
+        from hask3.lang import undefined
+
+        @sig(H/ int >> (str, None) >> t(Maybe, "a") >> "b" >> bool)
+        def ground(i, tup, maybe, anything):
+            return True
+
+        self.assertNotIn(None, ground.checkers)
+        self.assertTrue(ground(1, ("a", None), Just(1), object()))
+        self.assertTrue(ground(1)(("a", None))(Nothing)([]))
+        self.assertIs(undefined, ground(1, ("a", None), Nothing, undefined))
+        with self.assertRaises(TypeError):
+            ground(True, ("a", None), Nothing, 1)
+        with self.assertRaises(TypeError):
+            ground(1, ("a", 1), Nothing, 1)
+        with self.assertRaises(TypeError):
+            ground(1, ("a", None), Left(1), 1)
+
+        @sig(H[(Eq, "a")]/ "a" >> "b" >> "a" >> int)
+        def shared(x, y, z):
+            return 1
+
+        self.assertEqual(2, shared.checkers.count(None))
+        self.assertIsNotNone(shared.checkers[1])
+        self.assertEqual(1, shared(1, "b", 2))
+        with self.assertRaises(TypeError):
+            shared(1, "b", "c")
+
+        @sig(H/ str >> int)
+        def liar(s):
+            return s
+
+        with self.assertRaises(TypeError):
+            liar("a")
+
+    def test_typecheck_modes(self):
+        from hask3 import typecheck
+        from hask3.lang.type_system import _parse_typecheck
+
+        loose = (lambda x, y: x + y) ** (H/ int >> int >> int)
+        with typecheck("off"):
+            self.assertEqual("ab", loose("a", "b"))
+            self.assertEqual("ab", loose("a")("b"))
+        with self.assertRaises(TypeError):
+            loose("a", "b")
+
+        with typecheck("sampled", sample_rate=3):
+            results = []
+            for i in range(6):
+                try:
+                    results.append(loose("a", "b"))
+                except TypeError:
+                    results.append(None)
+            self.assertEqual([None, "ab", "ab", None, "ab", "ab"], results)
+
+        @sig(H/ int >> int >> int, typecheck="full")
+        def strict(x, y):
+            return x + y
+
+        @sig(H/ int >> int >> int, typecheck="off")
+        def unchecked(x, y):
+            return x + y
+
+        with typecheck("off"):
+            with self.assertRaises(TypeError):
+                strict("a", "b")
+        self.assertEqual("ab", unchecked("a")("b"))
+
+        # the mode is local to the thread
+        from threading import Thread
+        modes = []
+        with typecheck("off"):
+            thread = Thread(target=lambda: modes.append(typecheck.current()))
+            thread.start()
+            thread.join()
+            self.assertEqual(("off", 1), typecheck.current())
+        self.assertEqual([("full", 1)], modes)
+
+        self.assertEqual(("sampled", 10), _parse_typecheck("Sampled:10"))
+        self.assertEqual(("off", 1), _parse_typecheck("off"))
+        with self.assertRaises(ValueError):
+            _parse_typecheck("sometimes")
+        with self.assertRaises(ValueError):
+            typecheck("sampled", sample_rate=0)
+
+    def test_typecheck_undefined(self):
+        from hask3 import typecheck, caseof, m, p
+
+        @sig(H/ int >> int)
+        def fib(x):
+            return ~(caseof(x)
+                     | m(0) >> 1
+                     | m(1) >> 1
+                     | m(m.n) >> fib(p.n - 2) + fib(p.n - 1))
+
+        for mode in ("full", "sampled", "off"):
+            with typecheck(mode):
+                self.assertEqual(13, fib(6))
+
     def test_match(self):
         match_only = lambda v, p: pattern_match(v, p)[0]
         pb = PatternMatchBind
@@ -187,3 +329,63 @@ class TestTypeSystem(unittest.TestCase):
             pattern_match((1, 2), (pb("c"), pb("a")), {"c": 1})
         with self.assertRaises(SyntaxError):
             pattern_match((1, 2), (pb("c"), pb("a")), {"a": 1})
+
+    def test_compiled_match(self):
+        from hask3 import cases, m, IncompletePatternError
+        from hask3.lang.type_system import PatternTable
+        pb = PatternMatchBind
+
+        table = PatternTable([1, "a", Just(pb("x")), Nothing,
+                              (pb("a"), 2), 2, pb("_")])
+        self.assertEqual([(), (), ("x", ), (), ("a", ), (), ()], table.names)
+        self.assertEqual((0, []), table.match(1))
+        self.assertEqual((1, []), table.match("a"))
+        self.assertEqual((2, [3]), table.match(Just(3)))
+        self.assertEqual((3, []), table.match(Nothing))
+        self.assertEqual((4, [1]), table.match((1, 2)))
+        self.assertEqual((5, []), table.match(2))
+        self.assertEqual((6, []), table.match(True))
+        self.assertEqual((6, []), table.match(1.0))
+        self.assertIsNone(PatternTable([1]).match(2))
+        with self.assertRaises(SyntaxError):
+            PatternTable([(pb("a"), pb("a"))])
+
+        describe = cases(
+            (L[[]], lambda: "empty"),
+            (L[[m.x]], lambda x: f"one {x}"),
+            (m.x ^ (m.y ^ m.z), lambda x, y, z: f"{x}, {y} and {len(z)}"),
+        )
+        self.assertEqual("empty", describe(L[[]]))
+        self.assertEqual("one 1", describe(L[[1]]))
+        self.assertEqual("1, 2 and 3", describe(L[1, ..., 5]))
+        self.assertEqual("1, 2 and 0", describe(L[1, 2]))
+
+        get = cases((Just(m.x), lambda default, x: x),
+                    (Nothing, lambda default: default))
+        self.assertEqual(1, get(Just(1), 0))
+        self.assertEqual(0, get(Nothing, 0))
+        with self.assertRaises(IncompletePatternError):
+            get(Left(1), 0)
+
+    def test_adt_slots(self):
+        from hask3 import data, d, m
+        from hask3.lang.type_system import PatternTable
+        Shape, Circle, Rect, Dot = (
+            data.Shape("a", "b") == d.Circle("a") | d.Rect("a", "b") | d.Dot
+        )
+
+        table = PatternTable([Rect(m.w, 1.0), Rect(m._, m.h),
+                              Circle(m.r), m.s])
+        self.assertEqual((0, [2.0]), table.match(Rect(2.0, 1.0)))
+        self.assertEqual((1, [3.0]), table.match(Rect(2.0, 3.0)))
+        self.assertEqual((2, [1.0]), table.match(Circle(1.0)))
+        self.assertEqual((3, [Dot]), table.match(Dot))
+        self.assertEqual((3, [Just(1)]), table.match(Just(1)))
+
+        self.assertEqual((True, {"w": 2.0, "h": 3.0}),
+                         pattern_match(Rect(2.0, 3.0),
+                                       Rect(m.w, m.h)))
+        self.assertFalse(pattern_match(Rect(2.0, 3.0),
+                                       Rect(m.w, 1.0))[0])
+        self.assertFalse(pattern_match(Circle(2.0), Rect(2.0, 1.0))[0])
+        self.assertTrue(pattern_match(Dot, Dot)[0])